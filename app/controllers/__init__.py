@@ -1,5 +1,6 @@
 """Controllers module."""
+from app.controllers.change_feed import ChangeFeedController
+from app.controllers.metrics import MetricsController
 from app.controllers.user import UserController
 
-__all__ = ["UserController"]
-
+__all__ = ["ChangeFeedController", "MetricsController", "UserController"]
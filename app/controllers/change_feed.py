@@ -0,0 +1,103 @@
+"""User change feed controller."""
+import asyncio
+from typing import AsyncIterator, List
+
+import msgspec
+from litestar import Controller, Request, WebSocket, get, websocket
+from litestar.exceptions import WebSocketDisconnect
+from litestar.response import ServerSentEvent, ServerSentEventMessage
+
+from app.config import settings
+from app.logger import get_logger
+from app.rabbitmq.change_feed import ChangeFeedSubscription, change_feed
+
+logger = get_logger(__name__)
+
+# Close code for clients disconnected by the slow client policy ("Try Again Later")
+WS_CLOSE_TRY_AGAIN_LATER = 1013
+
+
+async def _close_on_disconnect(socket: WebSocket, subscription: ChangeFeedSubscription) -> None:
+    """Read from the socket until the client goes away, then end the subscription.
+
+    Without a reader a filtered client that receives no events would never
+    notice the disconnect.
+    """
+    try:
+        while True:
+            await socket.receive_data(mode="text")
+    except WebSocketDisconnect:
+        pass
+    finally:
+        subscription.close()
+
+
+class ChangeFeedController(Controller):
+    """User change feed controller."""
+
+    path = "/users/changes"
+    tags = ["Users"]
+
+    @get(
+        "/",
+        summary="Stream user changes",
+        description="Server-Sent Events stream of user.created/updated/deleted events",
+    )
+    async def stream_changes(
+        self, request: Request, user_id: List[int] | None = None
+    ) -> ServerSentEvent:
+        """Stream user changes over SSE."""
+        subscription = change_feed.subscribe(
+            user_ids=set(user_id) if user_id else None,
+            last_event_id=request.headers.get("Last-Event-ID") or None,
+        )
+        return ServerSentEvent(self._sse_messages(subscription))
+
+    @staticmethod
+    async def _sse_messages(
+        subscription: ChangeFeedSubscription,
+    ) -> AsyncIterator[ServerSentEventMessage]:
+        """Render subscription events as SSE messages."""
+        try:
+            async for event in subscription.events(settings.change_feed_ping_interval_seconds):
+                if event is None:
+                    # Keep the connection alive and detect gone clients
+                    yield ServerSentEventMessage(data=None, comment="ping")
+                    continue
+                yield ServerSentEventMessage(
+                    data=msgspec.json.encode(event.data).decode(),
+                    event=event.event_type,
+                    # A resync without history has no ID to resume from
+                    id=event.id or None,
+                )
+        finally:
+            change_feed.unsubscribe(subscription)
+
+    @websocket("/ws")
+    async def websocket_changes(
+        self,
+        socket: WebSocket,
+        user_id: List[int] | None = None,
+        last_event_id: str | None = None,
+    ) -> None:
+        """Stream user changes over WebSocket."""
+        await socket.accept()
+        subscription = change_feed.subscribe(
+            user_ids=set(user_id) if user_id else None,
+            last_event_id=last_event_id,
+        )
+        receiver = asyncio.create_task(_close_on_disconnect(socket, subscription))
+        try:
+            async for event in subscription.events(settings.change_feed_ping_interval_seconds):
+                if event is None:
+                    continue
+                await socket.send_data(msgspec.json.encode(event))
+
+            if not receiver.done():
+                # The feed ended: the client was too slow or the app is shutting down
+                await socket.close(code=WS_CLOSE_TRY_AGAIN_LATER)
+        except WebSocketDisconnect:
+            pass
+        finally:
+            receiver.cancel()
+            change_feed.unsubscribe(subscription)
@@ -0,0 +1,25 @@
+"""Metrics controller."""
+from litestar import Controller, get
+
+from app.monitoring.event_metrics import event_latency
+from app.monitoring.loop_monitor import loop_monitor
+from app.schemas.metrics import MetricsResponse
+
+
+class MetricsController(Controller):
+    """Metrics controller."""
+
+    path = "/metrics"
+    tags = ["Metrics"]
+
+    @get(
+        "/",
+        summary="Get metrics",
+        description="Get in-process runtime metrics",
+    )
+    async def get_metrics(self) -> MetricsResponse:
+        """Get runtime metrics."""
+        return MetricsResponse(
+            event_loop=loop_monitor.snapshot(),
+            events=event_latency.snapshot(),
+        )
@@ -1,16 +1,28 @@
 """User controller."""
 from typing import List
 
-from litestar import Controller, delete, get, post, put
+from asyncpg import Pool
+from litestar import Controller, Request, delete, get, post, put
 from litestar.di import Provide
 from litestar.exceptions import HTTPException
-from litestar.status_codes import HTTP_201_CREATED, HTTP_204_NO_CONTENT
+from litestar.params import Parameter
+from litestar.status_codes import HTTP_200_OK, HTTP_201_CREATED, HTTP_204_NO_CONTENT
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.db.base import get_session
 from app.logger import get_logger, trace_id_context
-from app.schemas.user import UserCreate, UserResponse, UserUpdate
+from app.schemas.user import (
+    UserCreate,
+    UserImportResult,
+    UserResponse,
+    UserStatsResponse,
+    UserUpdate,
+)
 from app.services.user import UserService
+from app.services.user_import import ImportFormat, UserImportService
+from app.services.user_read import AsyncpgUserReader, OrmUserReader, UserReader
+from app.services.user_stats import UserStatsService
 
 logger = get_logger(__name__)
 
@@ -20,6 +32,36 @@ async def get_user_service(session: AsyncSession = Provide(get_session)) -> User
     return UserService(session=session)
 
 
+async def get_orm_user_reader(service: UserService) -> UserReader:
+    """Dependency for the ORM read path."""
+    return OrmUserReader(service=service)
+
+
+def get_asyncpg_user_reader(db_pool: Pool) -> UserReader:
+    """Dependency for the raw asyncpg read path."""
+    return AsyncpgUserReader(pool=db_pool)
+
+
+if settings.read_path == "asyncpg":
+    provide_user_reader = Provide(get_asyncpg_user_reader, sync_to_thread=False)
+else:
+    provide_user_reader = Provide(get_orm_user_reader)
+
+
+async def get_user_import_service(
+    session: AsyncSession = Provide(get_session),
+) -> UserImportService:
+    """Dependency for user import service."""
+    return UserImportService(session=session)
+
+
+async def get_user_stats_service(
+    session: AsyncSession = Provide(get_session),
+) -> UserStatsService:
+    """Dependency for user statistics service."""
+    return UserStatsService(session=session)
+
+
 class UserController(Controller):
     """User controller."""
 
@@ -38,11 +80,19 @@ class UserController(Controller):
     ) -> UserResponse:
         """Create a new user."""
         try:
-            user = await service.create_user(data)
+            user, committed_at = await service.create_user(data)
             
             # Publish event to RabbitMQ
             from app.rabbitmq.producer import publish_user_event
-            await publish_user_event("user.created", {"user_id": user.id, "name": user.name})
+            await publish_user_event(
+                "user.created",
+                {
+                    "user_id": user.id,
+                    "name": user.name,
+                    "created_at": user.created_at.isoformat(),
+                    "committed_at": committed_at.isoformat(),
+                },
+            )
             
             return UserResponse(
                 id=user.id,
@@ -55,47 +105,89 @@ class UserController(Controller):
             logger.error("error_creating_user", error=str(e), exc_info=True)
             raise HTTPException(detail=str(e)) from e
 
+    @post(
+        "/import",
+        status_code=HTTP_200_OK,
+        summary="Import users",
+        description="Bulk import users from a streamed CSV or NDJSON upload",
+        dependencies={"import_service": Provide(get_user_import_service)},
+        request_max_body_size=None,
+    )
+    async def import_users(
+        self,
+        request: Request,
+        import_service: UserImportService,
+        fmt: ImportFormat | None = Parameter(query="format", default=None),
+    ) -> UserImportResult:
+        """Import users from the request body stream."""
+        if fmt is None:
+            content_type = request.headers.get("Content-Type", "")
+            fmt = "csv" if content_type.startswith("text/csv") else "ndjson"
+        
+        try:
+            result = await import_service.import_users(request.stream(), fmt)
+            
+            # Publish a single summary event instead of one event per row
+            from app.rabbitmq.producer import publish_user_event
+            await publish_user_event(
+                "user.imported",
+                {
+                    "imported": result.imported,
+                    "failed": result.failed,
+                    "created_at": result.imported_at.isoformat(),
+                    "committed_at": result.imported_at.isoformat(),
+                },
+            )
+            
+            return result
+        except Exception as e:
+            logger.error("error_importing_users", error=str(e), exc_info=True)
+            raise HTTPException(detail=str(e)) from e
+
     @get(
         "/",
         summary="Get users",
         description="Get list of users",
+        dependencies={"reader": provide_user_reader},
     )
     async def get_users(
-        self, service: UserService, skip: int = 0, limit: int = 100
+        self, reader: UserReader, skip: int = 0, limit: int = 100
     ) -> List[UserResponse]:
         """Get list of users."""
         try:
-            users = await service.get_users(skip=skip, limit=limit)
-            return [
-                UserResponse(
-                    id=user.id,
-                    name=user.name,
-                    surname=user.surname,
-                    created_at=user.created_at,
-                    updated_at=user.updated_at,
-                )
-                for user in users
-            ]
+            return await reader.get_users(skip=skip, limit=limit)
         except Exception as e:
             logger.error("error_getting_users", error=str(e), exc_info=True)
             raise HTTPException(detail=str(e)) from e
 
+    @get(
+        "/stats",
+        summary="Get user statistics",
+        description="Get total user count and sign-ups per day",
+        dependencies={"stats_service": Provide(get_user_stats_service)},
+    )
+    async def get_user_stats(
+        self,
+        stats_service: UserStatsService,
+        days: int = Parameter(default=30, ge=1, le=366),
+    ) -> UserStatsResponse:
+        """Get user statistics."""
+        try:
+            return await stats_service.get_stats(days=days)
+        except Exception as e:
+            logger.error("error_getting_user_stats", error=str(e), exc_info=True)
+            raise HTTPException(detail=str(e)) from e
+
     @get(
         "/{user_id:int}",
         summary="Get user",
         description="Get user by ID",
+        dependencies={"reader": provide_user_reader},
     )
-    async def get_user(self, user_id: int, service: UserService) -> UserResponse:
+    async def get_user(self, user_id: int, reader: UserReader) -> UserResponse:
         """Get user by ID."""
         try:
-            user = await service.get_user(user_id)
-            return UserResponse(
-                id=user.id,
-                name=user.name,
-                surname=user.surname,
-                created_at=user.created_at,
-                updated_at=user.updated_at,
-            )
+            return await reader.get_user(user_id)
         except Exception as e:
             logger.error("error_getting_user", user_id=user_id, error=str(e), exc_info=True)
             raise HTTPException(detail=str(e)) from e
@@ -136,11 +228,18 @@ class UserController(Controller):
     async def delete_user(self, user_id: int, service: UserService) -> None:
         """Delete user."""
         try:
-            await service.delete_user(user_id)
+            user, committed_at = await service.delete_user(user_id)
             
             # Publish event to RabbitMQ
             from app.rabbitmq.producer import publish_user_event
-            await publish_user_event("user.deleted", {"user_id": user_id})
+            await publish_user_event(
+                "user.deleted",
+                {
+                    "user_id": user_id,
+                    "created_at": user.created_at.isoformat(),
+                    "committed_at": committed_at.isoformat(),
+                },
+            )
         except Exception as e:
             logger.error("error_deleting_user", user_id=user_id, error=str(e), exc_info=True)
             raise HTTPException(detail=str(e)) from e
@@ -1,6 +1,5 @@
 """Database module."""
 from app.db.base import Base, get_session
-from app.db.models import User
-
-__all__ = ["Base", "get_session", "User"]
+from app.db.models import User, UserDailySignups, UserStats
 
+__all__ = ["Base", "get_session", "User", "UserDailySignups", "UserStats"]
@@ -1,18 +1,26 @@
 """Database base configuration."""
+from datetime import datetime
+
 from advanced_alchemy import SQLAlchemyAsyncRepository
 from advanced_alchemy.base import UUIDAuditBase, BigIntAuditBase
 from advanced_alchemy.extensions.litestar import (
     AlembicAsyncConfig,
     AsyncSessionConfig,
+    EngineConfig,
     SQLAlchemyAsyncConfig,
 )
 from litestar.contrib.sqlalchemy import init_plugin_config
+from litestar_asyncpg import AsyncpgConfig, AsyncpgPlugin, PoolConfig
+from sqlalchemy import DateTime, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 
 db_config = SQLAlchemyAsyncConfig(
     connection_string=settings.database_url,
     session_config=AsyncSessionConfig(expire_on_commit=False),
+    # Timestamps are timestamptz; UTC sessions keep created_at::date on UTC days
+    engine_config=EngineConfig(connect_args={"server_settings": {"timezone": "UTC"}}),
     alembic_config=AlembicAsyncConfig(
         version_table_name="alembic_version",
         script_config=dict(
@@ -26,6 +34,16 @@ db_config = SQLAlchemyAsyncConfig(
 
 sqlalchemy_config = init_plugin_config(db_config)
 
+# Raw asyncpg pool for the ORM-free read path
+asyncpg_config = AsyncpgConfig(
+    pool_config=PoolConfig(
+        dsn=settings.database_url.replace("+asyncpg", ""),
+        max_size=settings.read_pool_max_size,
+    ),
+)
+
+asyncpg_plugin = AsyncpgPlugin(config=asyncpg_config)
+
 # Base classes
 Base = BigIntAuditBase
 
@@ -41,3 +59,12 @@ async def get_session():
     async with db_config.get_session() as session:
         yield session
 
+
+
+async def get_db_timestamp(session: AsyncSession) -> datetime:
+    """Get the current database time as an aware datetime.
+
+    Taken right before commit, it stands in for the commit time of the
+    transaction, which is what the user statistics watermark is compared with.
+    """
+    return await session.scalar(select(func.clock_timestamp(type_=DateTime(timezone=True))))
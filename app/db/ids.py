@@ -0,0 +1,75 @@
+"""Application-generated 64-bit IDs."""
+import threading
+import time
+
+from app.config import settings
+
+TIMESTAMP_BITS = 41
+WORKER_ID_BITS = 10
+SEQUENCE_BITS = 12
+
+MAX_WORKER_ID = (1 << WORKER_ID_BITS) - 1
+MAX_SEQUENCE = (1 << SEQUENCE_BITS) - 1
+
+
+def _now_ms() -> int:
+    """Get current unix time in milliseconds."""
+    return time.time_ns() // 1_000_000
+
+
+class SnowflakeGenerator:
+    """Snowflake-style ID generator.
+
+    IDs are ``timestamp | worker_id | sequence`` packed into 63 bits, so they
+    fit a signed ``bigint`` column and sort by creation time.
+    """
+
+    def __init__(self, worker_id: int, epoch_ms: int):
+        """Initialize generator."""
+        if not 0 <= worker_id <= MAX_WORKER_ID:
+            raise ValueError(f"worker_id must be between 0 and {MAX_WORKER_ID}")
+
+        self.worker_id = worker_id
+        self.epoch_ms = epoch_ms
+        self._last_ms = -1
+        self._sequence = 0
+        self._lock = threading.Lock()
+
+    def next_id(self) -> int:
+        """Generate next ID.
+
+        Never blocks: if the clock moved backwards or the sequence of the
+        current millisecond is exhausted, the ID is built on top of the last
+        used timestamp instead of waiting for the clock to catch up.
+        """
+        with self._lock:
+            now = max(_now_ms(), self._last_ms)
+            if now == self._last_ms:
+                self._sequence = (self._sequence + 1) & MAX_SEQUENCE
+                if self._sequence == 0:
+                    # Sequence exhausted, borrow the next millisecond
+                    now += 1
+            else:
+                self._sequence = 0
+
+            self._last_ms = now
+            return (
+                ((now - self.epoch_ms) << (WORKER_ID_BITS + SEQUENCE_BITS))
+                | (self.worker_id << SEQUENCE_BITS)
+                | self._sequence
+            )
+
+
+_generator = SnowflakeGenerator(
+    worker_id=settings.worker_id, epoch_ms=settings.snowflake_epoch_ms
+)
+
+
+def generate_id() -> int:
+    """Generate a time-ordered 64-bit ID."""
+    return _generator.next_id()
+
+
+def use_app_generated_ids() -> bool:
+    """Check whether primary keys are generated by the application."""
+    return settings.id_strategy == "snowflake"
@@ -1,8 +1,8 @@
 """Database models."""
-from datetime import datetime
+from datetime import date, datetime
 
 from advanced_alchemy.base import BigIntPrimaryKey
-from sqlalchemy import Text, func
+from sqlalchemy import BigInteger, Text, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -24,3 +24,21 @@ class User(Base):
         server_default=func.now(), onupdate=func.now(), nullable=False
     )
 
+
+
+class UserStats(Base):
+    """Incrementally maintained user totals (single row)."""
+
+    __tablename__ = "user_stats"
+
+    total: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    reconciled_at: Mapped[datetime | None] = mapped_column(nullable=True)
+
+
+class UserDailySignups(Base):
+    """Incrementally maintained sign-ups per day."""
+
+    __tablename__ = "user_daily_signups"
+
+    day: Mapped[date] = mapped_column(unique=True, nullable=False)
+    signups: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
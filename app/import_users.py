@@ -0,0 +1,68 @@
+"""Bulk import users from a CSV or NDJSON file.
+
+Usage:
+    python -m app.import_users users.csv [--format csv|ndjson]
+"""
+import argparse
+import asyncio
+from pathlib import Path
+from typing import AsyncIterator
+
+from app.db.base import db_config
+from app.logger import configure_logging, get_logger
+from app.rabbitmq.producer import close_rabbitmq, init_rabbitmq, publish_user_event
+from app.schemas.user import UserImportResult
+from app.services.user_import import ImportFormat, UserImportService
+
+logger = get_logger(__name__)
+
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+async def read_file(path: Path) -> AsyncIterator[bytes]:
+    """Read file in fixed-size chunks off the event loop."""
+    with path.open("rb") as file:
+        while chunk := await asyncio.to_thread(file.read, READ_CHUNK_SIZE):
+            yield chunk
+
+
+async def import_file(path: Path, fmt: ImportFormat) -> UserImportResult:
+    """Import users from file and publish a summary event."""
+    async with db_config.get_session() as session:
+        result = await UserImportService(session=session).import_users(read_file(path), fmt)
+
+    try:
+        await init_rabbitmq()
+        await publish_user_event(
+            "user.imported",
+            {
+                "imported": result.imported,
+                "failed": result.failed,
+                "created_at": result.imported_at.isoformat(),
+                "committed_at": result.imported_at.isoformat(),
+            },
+        )
+        await close_rabbitmq()
+    except Exception as e:
+        logger.error("failed_to_publish_import_event", error=str(e), exc_info=True)
+
+    return result
+
+
+def main() -> None:
+    """CLI entrypoint."""
+    parser = argparse.ArgumentParser(description="Bulk import users from CSV or NDJSON")
+    parser.add_argument("path", type=Path, help="Path to CSV or NDJSON file")
+    parser.add_argument("--format", choices=["csv", "ndjson"], default=None)
+    args = parser.parse_args()
+
+    fmt = args.format or ("csv" if args.path.suffix.lower() == ".csv" else "ndjson")
+
+    configure_logging()
+    result = asyncio.run(import_file(args.path, fmt))
+    for error in result.errors:
+        logger.warning("import_row_rejected", line=error.line, error=error.error)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,12 +6,18 @@ from litestar.config.cors import CORSConfig
 from litestar.openapi import OpenAPIConfig
 
 from app.config import settings
+from app.controllers.change_feed import ChangeFeedController
+from app.controllers.metrics import MetricsController
 from app.controllers.user import UserController
-from app.db.base import sqlalchemy_config
+from app.db.base import asyncpg_plugin, sqlalchemy_config
 from app.logger import configure_logging, get_logger
 from app.middleware.trace_id import TraceIDMiddleware
+from app.monitoring.loop_monitor import close_loop_monitor, setup_loop_monitor
+from app.monitoring.tracing import close_tracing, setup_tracing
+from app.rabbitmq.change_feed import close_change_feed, setup_change_feed
 from app.rabbitmq.consumer import close_consumer, setup_consumer
 from app.rabbitmq.producer import close_rabbitmq, init_rabbitmq
+from app.services.user_stats import close_stats_reconciler, setup_stats_reconciler
 
 logger = get_logger(__name__)
 
@@ -22,6 +28,18 @@ async def lifespan(app: Litestar):
     # Startup
     logger.info("application_starting")
     
+    # Start event loop monitor first to catch blocking calls during startup
+    try:
+        await setup_loop_monitor()
+    except Exception as e:
+        logger.error("failed_to_setup_loop_monitor", error=str(e), exc_info=True)
+    
+    # Start span export before anything produces spans
+    try:
+        await setup_tracing()
+    except Exception as e:
+        logger.error("failed_to_setup_tracing", error=str(e), exc_info=True)
+    
     # Initialize RabbitMQ producer
     try:
         await init_rabbitmq()
@@ -36,6 +54,18 @@ async def lifespan(app: Litestar):
         logger.error("failed_to_setup_consumer", error=str(e), exc_info=True)
         # Continue even if consumer fails
     
+    # Subscribe change feed to user events
+    try:
+        await setup_change_feed()
+    except Exception as e:
+        logger.error("failed_to_setup_change_feed", error=str(e), exc_info=True)
+    
+    # Start periodic reconciliation of user statistics
+    try:
+        await setup_stats_reconciler()
+    except Exception as e:
+        logger.error("failed_to_setup_stats_reconciler", error=str(e), exc_info=True)
+    
     logger.info("application_started")
     
     yield
@@ -43,6 +73,16 @@ async def lifespan(app: Litestar):
     # Shutdown
     logger.info("application_shutting_down")
     
+    try:
+        await close_change_feed()
+    except Exception as e:
+        logger.error("error_closing_change_feed", error=str(e), exc_info=True)
+    
+    try:
+        await close_stats_reconciler()
+    except Exception as e:
+        logger.error("error_closing_stats_reconciler", error=str(e), exc_info=True)
+    
     try:
         await close_consumer()
     except Exception as e:
@@ -53,6 +93,16 @@ async def lifespan(app: Litestar):
     except Exception as e:
         logger.error("error_closing_rabbitmq", error=str(e), exc_info=True)
     
+    try:
+        await close_tracing()
+    except Exception as e:
+        logger.error("error_closing_tracing", error=str(e), exc_info=True)
+    
+    try:
+        await close_loop_monitor()
+    except Exception as e:
+        logger.error("error_closing_loop_monitor", error=str(e), exc_info=True)
+    
     logger.info("application_shutdown")
 
 
@@ -62,13 +112,18 @@ configure_logging()
 # Create router
 api_router = Router(
     path=settings.api_prefix,
-    route_handlers=[UserController],
+    route_handlers=[UserController, ChangeFeedController, MetricsController],
 )
 
+# Database plugins; the raw asyncpg pool is only needed for the fast read path
+plugins = [sqlalchemy_config]
+if settings.read_path == "asyncpg":
+    plugins.append(asyncpg_plugin)
+
 # Create application
 app = Litestar(
     route_handlers=[api_router],
-    plugins=[sqlalchemy_config],
+    plugins=plugins,
     middleware=[TraceIDMiddleware],
     openapi_config=OpenAPIConfig(
         title=settings.app_name,
@@ -7,6 +7,7 @@ from litestar import Request
 from litestar.middleware import AbstractMiddleware
 
 from app.logger import get_logger, trace_id_context
+from app.monitoring.tracing import SpanKind, span
 
 logger = get_logger(__name__)
 
@@ -57,7 +58,13 @@ class TraceIDMiddleware(AbstractMiddleware):
         
         # Process request
         try:
-            await self.app(scope, receive, send_wrapper)
+            with span(
+                f"{request.method} {request.url.path}",
+                SpanKind.SERVER,
+                attributes={"http.method": request.method, "http.target": request.url.path},
+            ) as http_span:
+                await self.app(scope, receive, send_wrapper)
+                http_span.attributes["http.status_code"] = status_code
         except Exception as e:
             # Log error
             log.error(
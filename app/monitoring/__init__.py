@@ -0,0 +1,6 @@
+"""Monitoring module."""
+from app.monitoring.event_metrics import event_latency
+from app.monitoring.loop_monitor import loop_monitor
+from app.monitoring.metrics import Histogram
+
+__all__ = ["Histogram", "event_latency", "loop_monitor"]
@@ -0,0 +1,52 @@
+"""Event delivery latency metrics."""
+from typing import Dict
+
+from app.monitoring.metrics import Histogram
+from app.schemas.metrics import EventLatencyMetrics
+
+
+class EventLatency:
+    """Publish-to-consume latency histograms for one routing key."""
+
+    def __init__(self):
+        """Initialize histograms."""
+        self.publish_to_consume = Histogram()
+        self.queue_wait = Histogram()
+        self.handler = Histogram()
+
+    def snapshot(self) -> EventLatencyMetrics:
+        """Get histogram snapshots."""
+        return EventLatencyMetrics(
+            publish_to_consume_ms=self.publish_to_consume.snapshot(),
+            queue_wait_ms=self.queue_wait.snapshot(),
+            handler_ms=self.handler.snapshot(),
+        )
+
+
+class EventLatencyRegistry:
+    """Event latency histograms by routing key."""
+
+    def __init__(self):
+        """Initialize registry."""
+        self._by_routing_key: Dict[str, EventLatency] = {}
+
+    def record(self, routing_key: str, queue_wait_ms: float | None, handler_ms: float) -> None:
+        """Record delivery timings of a handled event.
+
+        ``queue_wait_ms`` is ``None`` for messages without a publish timestamp.
+        """
+        latency = self._by_routing_key.get(routing_key)
+        if latency is None:
+            latency = self._by_routing_key[routing_key] = EventLatency()
+
+        latency.handler.observe(handler_ms)
+        if queue_wait_ms is not None:
+            latency.queue_wait.observe(queue_wait_ms)
+            latency.publish_to_consume.observe(queue_wait_ms + handler_ms)
+
+    def snapshot(self) -> Dict[str, EventLatencyMetrics]:
+        """Get snapshots for every routing key."""
+        return {key: latency.snapshot() for key, latency in self._by_routing_key.items()}
+
+
+event_latency = EventLatencyRegistry()
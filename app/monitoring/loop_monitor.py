@@ -0,0 +1,137 @@
+"""Event loop lag and blocking-call monitor."""
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+
+from app.config import settings
+from app.logger import get_logger, trace_id_context
+from app.monitoring.metrics import Histogram
+from app.schemas.metrics import EventLoopMetrics
+
+logger = get_logger(__name__)
+
+
+class LoopMonitor:
+    """Event loop monitor.
+
+    A task on the loop sleeps for a fixed interval and records how late it
+    wakes up. A watchdog thread checks the task heartbeat and, when the loop
+    has not come back for longer than the threshold, logs the stack of the
+    loop thread together with the ``trace_id`` of the task that blocked it.
+    """
+
+    def __init__(self, interval_ms: int, threshold_ms: int):
+        """Initialize monitor."""
+        self.interval = interval_ms / 1000
+        self.threshold = threshold_ms / 1000
+        self.lag = Histogram()
+        self.blocked_count = 0
+        self.pending_tasks = 0
+        self.max_pending_tasks = 0
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat = time.monotonic()
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    def start(self) -> None:
+        """Start monitor on the running loop."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._measure_lag(), name="loop-monitor")
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-monitor-watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        """Stop monitor."""
+        self._stopped.set()
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._watchdog:
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+
+    def snapshot(self) -> EventLoopMetrics:
+        """Get current event loop metrics."""
+        return EventLoopMetrics(
+            lag_ms=self.lag.snapshot(),
+            blocked_count=self.blocked_count,
+            pending_tasks=self.pending_tasks,
+            max_pending_tasks=self.max_pending_tasks,
+        )
+
+    async def _measure_lag(self) -> None:
+        """Record how late the loop wakes up after each interval."""
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self._heartbeat = now
+            self.lag.observe(max(now - expected, 0.0) * 1000)
+
+            self.pending_tasks = len(asyncio.all_tasks())
+            self.max_pending_tasks = max(self.max_pending_tasks, self.pending_tasks)
+
+    def _watch(self) -> None:
+        """Log the loop thread stack when the loop stops responding."""
+        reported_heartbeat = None
+        while not self._stopped.wait(self.interval):
+            heartbeat = self._heartbeat
+            blocked = time.monotonic() - heartbeat - self.interval
+            if blocked < self.threshold or heartbeat == reported_heartbeat:
+                continue
+
+            # Report each blocking episode once
+            reported_heartbeat = heartbeat
+            self.blocked_count += 1
+            self._report_blocked(blocked)
+
+    def _report_blocked(self, blocked: float) -> None:
+        """Log stack and trace_id of whatever is running on the loop thread."""
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = "".join(traceback.format_stack(frame)) if frame else None
+
+        task = asyncio.current_task(self._loop)
+        trace_id = None
+        if task is not None and hasattr(task, "get_context"):
+            trace_id = task.get_context().get(trace_id_context)
+
+        logger.warning(
+            "event_loop_blocked",
+            blocked_ms=round(blocked * 1000, 2),
+            task=task.get_name() if task else None,
+            trace_id=trace_id,
+            stack=stack,
+        )
+
+
+loop_monitor = LoopMonitor(
+    interval_ms=settings.loop_monitor_interval_ms,
+    threshold_ms=settings.loop_lag_threshold_ms,
+)
+
+
+async def setup_loop_monitor() -> None:
+    """Start event loop monitor."""
+    loop_monitor.start()
+    logger.info("loop_monitor_started")
+
+
+async def close_loop_monitor() -> None:
+    """Stop event loop monitor."""
+    await loop_monitor.stop()
+    logger.info("loop_monitor_stopped")
@@ -0,0 +1,47 @@
+"""In-process metrics primitives."""
+import bisect
+from typing import Sequence
+
+from app.schemas.metrics import HistogramSnapshot
+
+# Default histogram bucket upper bounds, in milliseconds
+DEFAULT_BUCKETS_MS: Sequence[float] = (
+    1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000,
+)
+
+
+class Histogram:
+    """Fixed-bucket histogram.
+
+    Counts are cumulative per upper bound, the last bucket is ``+Inf``.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS_MS):
+        """Initialize histogram."""
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record a value."""
+        self._counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def snapshot(self) -> HistogramSnapshot:
+        """Get cumulative bucket counts and totals."""
+        buckets = {}
+        total = 0
+        for bound, bucket_count in zip([*map(str, self.buckets), "+Inf"], self._counts):
+            total += bucket_count
+            buckets[bound] = total
+        return HistogramSnapshot(
+            buckets=buckets,
+            count=self.count,
+            sum=round(self.sum, 3),
+            max=round(self.max, 3),
+        )
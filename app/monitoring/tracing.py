@@ -0,0 +1,316 @@
+"""Lightweight tracing with an OTLP/JSON file exporter."""
+import asyncio
+import functools
+import hashlib
+import json
+import secrets
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import settings
+from app.db.base import db_config
+from app.logger import get_logger, trace_id_context
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class SpanKind(IntEnum):
+    """OTLP span kinds."""
+
+    INTERNAL = 1
+    SERVER = 2
+    CLIENT = 3
+    PRODUCER = 4
+    CONSUMER = 5
+
+
+def otlp_trace_id(trace_id: str | None) -> str:
+    """Convert an application ``trace_id`` to a 32 hex digit OTLP trace ID."""
+    if not trace_id:
+        return uuid.uuid4().hex
+    try:
+        return uuid.UUID(trace_id).hex
+    except ValueError:
+        return hashlib.sha256(trace_id.encode()).hexdigest()[:32]
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    """Encode an attribute value as OTLP ``AnyValue``."""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class Span:
+    """A finished or in-flight span."""
+
+    __slots__ = (
+        "name",
+        "kind",
+        "trace_id",
+        "span_id",
+        "parent_span_id",
+        "attributes",
+        "start_ns",
+        "end_ns",
+        "error",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        kind: SpanKind,
+        trace_id: str,
+        parent_span_id: str,
+        attributes: Dict[str, Any],
+    ):
+        """Initialize span."""
+        self.name = name
+        self.kind = kind
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_span_id = parent_span_id
+        self.attributes = attributes
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.error: Optional[str] = None
+
+    @property
+    def traceparent(self) -> str:
+        """W3C ``traceparent`` header value pointing at this span."""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def end(self, error: BaseException | None = None) -> None:
+        """Finish span and hand it to the exporter."""
+        if self.end_ns is not None:
+            return
+        self.end_ns = time.time_ns()
+        if error is not None:
+            self.error = str(error) or type(error).__name__
+        exporter.add(self)
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """Encode span as OTLP/JSON."""
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_span_id,
+            "name": self.name,
+            "kind": int(self.kind),
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)}
+                for key, value in self.attributes.items()
+                if value is not None
+            ],
+            "status": {"code": 2, "message": self.error} if self.error else {"code": 1},
+        }
+
+
+# Span that new spans are attached to
+current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def _parse_traceparent(traceparent: str) -> tuple[str, str] | None:
+    """Get trace ID and parent span ID from a W3C ``traceparent`` value."""
+    parts = traceparent.split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    return parts[1], parts[2]
+
+
+def start_span(
+    name: str,
+    kind: SpanKind = SpanKind.INTERNAL,
+    traceparent: str | None = None,
+    attributes: Dict[str, Any] | None = None,
+) -> Span:
+    """Start a span under ``traceparent`` or the current span, without activating it."""
+    trace_id = trace_id_context.get()
+    attributes = {**(attributes or {}), "trace_id": trace_id}
+
+    parent = current_span.get()
+    remote_parent = _parse_traceparent(traceparent) if traceparent else None
+    if remote_parent:
+        parent_trace_id, parent_span_id = remote_parent
+    elif parent:
+        parent_trace_id, parent_span_id = parent.trace_id, parent.span_id
+    else:
+        parent_trace_id, parent_span_id = otlp_trace_id(trace_id), ""
+
+    return Span(name, kind, parent_trace_id, parent_span_id, attributes)
+
+
+@contextmanager
+def span(
+    name: str,
+    kind: SpanKind = SpanKind.INTERNAL,
+    traceparent: str | None = None,
+    attributes: Dict[str, Any] | None = None,
+) -> Iterator[Span]:
+    """Run the block inside a new active span."""
+    active = start_span(name, kind, traceparent, attributes)
+    token = current_span.set(active)
+    try:
+        yield active
+    except BaseException as e:
+        active.end(error=e)
+        raise
+    finally:
+        current_span.reset(token)
+        active.end()
+
+
+def traced(
+    name: str | None = None,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Wrap an async function in a span named after it."""
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            with span(span_name):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Record a client span for every statement executed by the engine."""
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _before(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        conn.info.setdefault("trace_spans", []).append(
+            start_span("db.query", SpanKind.CLIENT, attributes={"db.statement": statement[:500]})
+        )
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def _after(conn: Any, *args: Any) -> None:
+        spans = conn.info.get("trace_spans")
+        if spans:
+            spans.pop().end()
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def _error(context: Any) -> None:
+        spans = context.connection.info.get("trace_spans") if context.connection else None
+        if spans:
+            spans.pop().end(error=context.original_exception)
+
+
+class FileSpanExporter:
+    """Exporter writing batches of spans as OTLP/JSON lines.
+
+    Spans are buffered in memory and serialized and written from a worker
+    thread, so the event loop never waits for encoding or file I/O.
+    """
+
+    def __init__(self, path: str, flush_interval: float, max_buffer: int = 10000):
+        """Initialize exporter."""
+        self.path = path
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.dropped = 0
+        self._buffer: List[Span] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def add(self, finished: Span) -> None:
+        """Buffer a finished span."""
+        if not self.path:
+            return
+        if len(self._buffer) >= self.max_buffer:
+            self.dropped += 1
+            return
+        self._buffer.append(finished)
+
+    async def flush(self) -> None:
+        """Write buffered spans to the file."""
+        if not self._buffer:
+            return
+        spans, self._buffer = self._buffer, []
+        await asyncio.to_thread(self._write, spans)
+
+    def _write(self, spans: List[Span]) -> None:
+        """Serialize finished spans and append them to the export file as one line."""
+        line = json.dumps(
+            {
+                "resourceSpans": [
+                    {
+                        "resource": {
+                            "attributes": [
+                                {"key": "service.name", "value": _otlp_value(settings.app_name)}
+                            ]
+                        },
+                        "scopeSpans": [
+                            {
+                                "scope": {"name": "app"},
+                                "spans": [finished.to_otlp() for finished in spans],
+                            }
+                        ],
+                    }
+                ]
+            }
+        )
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(line + "\n")
+
+    async def _run(self) -> None:
+        """Flush periodically."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error("trace_export_error", error=str(e), exc_info=True)
+
+    def start(self) -> None:
+        """Start periodic flushing."""
+        if self.path:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop periodic flushing and write remaining spans."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+exporter = FileSpanExporter(
+    path=settings.tracing_export_path,
+    flush_interval=settings.tracing_flush_interval_seconds,
+)
+
+
+async def setup_tracing() -> None:
+    """Instrument the database engine and start the span exporter."""
+    instrument_engine(db_config.get_engine())
+    exporter.start()
+    logger.info("tracing_started", export_path=settings.tracing_export_path)
+
+
+async def close_tracing() -> None:
+    """Flush remaining spans."""
+    await exporter.stop()
+    logger.info("tracing_stopped", dropped_spans=exporter.dropped)
@@ -0,0 +1,212 @@
+"""User change feed fan-out."""
+import asyncio
+import json
+from collections import deque
+from typing import AsyncIterator, Deque, Iterable, List, Optional, Set
+
+from aio_pika import connect_robust
+from aio_pika.abc import AbstractConnection, AbstractIncomingMessage
+
+from app.config import settings
+from app.logger import get_logger
+from app.rabbitmq.producer import EVENT_ID_HEADER, new_event_id
+from app.schemas.user import UserChangeEvent
+
+logger = get_logger(__name__)
+
+# Sent first when the requested resume point is unknown or no longer in history
+RESYNC_EVENT = "resync"
+
+
+class ChangeFeedSubscription:
+    """A connected change feed client with a bounded buffer."""
+
+    def __init__(
+        self,
+        user_ids: Optional[Set[int]],
+        maxsize: int,
+        replay: Iterable[UserChangeEvent] = (),
+    ):
+        """Initialize subscription."""
+        self.user_ids = user_ids
+        self.queue: asyncio.Queue[UserChangeEvent | None] = asyncio.Queue(maxsize=maxsize)
+        # Replayed lazily by the reader, so it does not count against the buffer
+        self.replay: Deque[UserChangeEvent] = deque(replay)
+        self.dropped = 0
+        self.closed = False
+
+    def matches(self, event: UserChangeEvent) -> bool:
+        """Check whether the event passes the user ID filter."""
+        return (
+            not self.user_ids
+            or event.event_type == RESYNC_EVENT
+            or event.data.get("user_id") in self.user_ids
+        )
+
+    def offer(self, event: UserChangeEvent, policy: str) -> bool:
+        """Buffer event without waiting. Returns False if the client was disconnected."""
+        if self.closed or not self.matches(event):
+            return not self.closed
+
+        try:
+            self.queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            pass
+
+        if policy == "drop":
+            self.queue.get_nowait()
+            self.queue.put_nowait(event)
+            self.dropped += 1
+            return True
+
+        self.close()
+        return False
+
+    def close(self) -> None:
+        """Discard buffered events and wake up the reader."""
+        self.closed = True
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+    async def events(self, ping_interval: float) -> AsyncIterator[UserChangeEvent | None]:
+        """Yield replayed and buffered events, or ``None`` after ``ping_interval`` of silence."""
+        while self.replay:
+            if self.closed:
+                return
+            event = self.replay.popleft()
+            if self.matches(event):
+                yield event
+
+        while True:
+            try:
+                event = await asyncio.wait_for(self.queue.get(), timeout=ping_interval)
+            except asyncio.TimeoutError:
+                yield None
+                continue
+            if event is None:
+                return
+            yield event
+
+
+class ChangeFeedHub:
+    """Fan-out of ``user_events`` to connected clients.
+
+    Each process holds a single exclusive queue bound to ``user.*`` and copies
+    every event to the buffer of each matching subscription. Recent events are
+    kept so clients can resume after a ``Last-Event-ID``. Event IDs are stamped
+    by the producer from a snowflake ID and its host name, so they are unique
+    and the same in every process and a client may resume on another instance;
+    if the ID is not in the history, a ``resync`` event tells the client to
+    reload its state first.
+    """
+
+    def __init__(self, history_size: int, client_buffer: int, slow_client_policy: str):
+        """Initialize hub."""
+        self.client_buffer = client_buffer
+        self.slow_client_policy = slow_client_policy
+        self._history: Deque[UserChangeEvent] = deque(maxlen=history_size)
+        self._subscriptions: Set[ChangeFeedSubscription] = set()
+        self._connection: Optional[AbstractConnection] = None
+
+    async def start(self) -> None:
+        """Subscribe to user events."""
+        self._connection = await connect_robust(settings.rabbitmq_url)
+        channel = await self._connection.channel()
+        exchange = await channel.declare_exchange("user_events", type="topic", durable=True)
+        queue = await channel.declare_queue(exclusive=True, auto_delete=True)
+        await queue.bind(exchange, routing_key="user.*")
+        await queue.consume(self._on_message, no_ack=True)
+
+    async def stop(self) -> None:
+        """Disconnect all clients and close the subscription."""
+        for subscription in list(self._subscriptions):
+            subscription.close()
+        self._subscriptions.clear()
+        if self._connection:
+            await self._connection.close()
+            self._connection = None
+
+    def subscribe(
+        self, user_ids: Optional[Set[int]] = None, last_event_id: Optional[str] = None
+    ) -> ChangeFeedSubscription:
+        """Register a client, replaying buffered events after ``last_event_id``."""
+        replay = [] if last_event_id is None else self._events_after(last_event_id)
+        subscription = ChangeFeedSubscription(
+            user_ids=user_ids, maxsize=self.client_buffer, replay=replay
+        )
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def _events_after(self, last_event_id: str) -> List[UserChangeEvent]:
+        """Get history after ``last_event_id``, or a resync event if it is unknown."""
+        history = list(self._history)
+        for index, event in enumerate(history):
+            if event.id == last_event_id:
+                return history[index + 1:]
+
+        logger.info("change_feed_resync_required", last_event_id=last_event_id)
+        # Carries the latest ID, so the client resumes from here after reloading
+        return [
+            UserChangeEvent(
+                id=history[-1].id if history else "", event_type=RESYNC_EVENT, data={}
+            )
+        ]
+
+    def unsubscribe(self, subscription: ChangeFeedSubscription) -> None:
+        """Unregister a client."""
+        self._subscriptions.discard(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of connected clients."""
+        return len(self._subscriptions)
+
+    async def _on_message(self, message: AbstractIncomingMessage) -> None:
+        """Copy an incoming event to every subscription."""
+        try:
+            body = json.loads(message.body.decode())
+        except ValueError as e:
+            logger.error("change_feed_invalid_message", error=str(e))
+            return
+
+        event_id = (message.headers or {}).get(EVENT_ID_HEADER)
+        if isinstance(event_id, bytes):
+            event_id = event_id.decode()
+        self.dispatch(
+            UserChangeEvent(
+                id=str(event_id) if event_id else new_event_id(),
+                event_type=message.routing_key or body.get("event_type", ""),
+                data=body.get("data", {}),
+                trace_id=body.get("trace_id"),
+            )
+        )
+
+    def dispatch(self, event: UserChangeEvent) -> None:
+        """Record an event in history and buffer it for every subscription."""
+        self._history.append(event)
+
+        for subscription in list(self._subscriptions):
+            if not subscription.offer(event, self.slow_client_policy):
+                self._subscriptions.discard(subscription)
+                logger.warning("change_feed_slow_client_disconnected")
+
+
+change_feed = ChangeFeedHub(
+    history_size=settings.change_feed_history_size,
+    client_buffer=settings.change_feed_client_buffer,
+    slow_client_policy=settings.change_feed_slow_client_policy,
+)
+
+
+async def setup_change_feed() -> None:
+    """Start change feed subscription."""
+    await change_feed.start()
+    logger.info("change_feed_started")
+
+
+async def close_change_feed() -> None:
+    """Stop change feed subscription."""
+    await change_feed.stop()
+    logger.info("change_feed_stopped")
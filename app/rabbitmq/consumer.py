@@ -1,15 +1,28 @@
 """RabbitMQ consumer."""
 import asyncio
 import json
+import time
 from contextvars import ContextVar
-from typing import Optional
+from typing import Any, Dict, Optional
 
-from faststream import FastStream
+from faststream import Context, FastStream
+from faststream.exceptions import NackMessage
 from faststream.rabbit import RabbitBroker
 from faststream.rabbit.annotations import RabbitMessage
 
 from app.config import settings
 from app.logger import get_logger, trace_id_context
+from app.monitoring.event_metrics import event_latency
+from app.monitoring.tracing import SpanKind, span
+from app.rabbitmq.producer import (
+    HOSTNAME,
+    PUBLISHED_AT_HEADER,
+    PUBLISHED_MONOTONIC_HEADER,
+    PUBLISHER_HOST_HEADER,
+    TRACEPARENT_HEADER,
+)
+from app.rabbitmq.retry import declare_retry_topology, schedule_retry, source_queue
+from app.services.user_stats import apply_user_event
 
 logger = get_logger(__name__)
 
@@ -26,50 +39,105 @@ app = FastStream(broker)
 _consumer_task: Optional[asyncio.Task] = None
 
 
-@broker.subscriber("user.created", exchange="user_events")
-@broker.subscriber("user.updated", exchange="user_events")
-@broker.subscriber("user.deleted", exchange="user_events")
+@app.after_startup
+async def _declare_retry_topology() -> None:
+    """Declare retry delay queues and the DLQ once the broker is connected."""
+    await declare_retry_topology(broker)
+
+
+@broker.subscriber(source_queue("user.created"), exchange="user_events")
+@broker.subscriber(source_queue("user.updated"), exchange="user_events")
+@broker.subscriber(source_queue("user.deleted"), exchange="user_events")
+@broker.subscriber(source_queue("user.imported"), exchange="user_events")
 async def handle_user_event(
     message: RabbitMessage,
-    routing_key: str,
+    routing_key: str = Context("message.raw_message.routing_key"),
 ) -> None:
     """Handle user events from RabbitMQ."""
-    trace_id = None
+    # Extract trace context from message headers
+    headers = message.headers or {}
+    trace_id = headers.get("trace_id")
+    
+    # Set trace_id in context
+    if trace_id:
+        trace_id_context.set(trace_id)
+        consumer_trace_id_context.set(trace_id)
+    
+    queue_wait_ms = _queue_wait_ms(headers)
+    started = time.perf_counter()
+    
+    with span(
+        f"consume {routing_key}",
+        SpanKind.CONSUMER,
+        traceparent=headers.get(TRACEPARENT_HEADER),
+        attributes={"messaging.destination": routing_key, "queue_wait_ms": queue_wait_ms},
+    ):
+        try:
+            # Parse message body
+            body = json.loads(message.body.decode())
+            event_data = body.get("data", {})
+            user_id = event_data.get("user_id")
+            
+            # Log event with trace_id
+            log = logger.bind(trace_id=trace_id)
+            log.info(
+                "event_received",
+                event_type=routing_key,
+                user_id=user_id,
+                trace_id=trace_id,
+                queue_wait_ms=queue_wait_ms,
+            )
+            
+            # Keep user statistics up to date
+            await apply_user_event(routing_key, event_data)
+            
+        except Exception as e:
+            log = logger.bind(trace_id=trace_id or trace_id_context.get())
+            log.error(
+                "error_handling_event",
+                routing_key=routing_key,
+                error=str(e),
+                exc_info=True,
+            )
+            
+            # Republish to a delay queue instead of retrying inline, so the failed
+            # message does not block the ones behind it
+            try:
+                await schedule_retry(broker, message, routing_key, e)
+            except Exception as retry_error:
+                log.error(
+                    "error_scheduling_retry",
+                    routing_key=routing_key,
+                    error=str(retry_error),
+                    exc_info=True,
+                )
+                # Dead-letter via the queue instead of requeueing to the head
+                raise NackMessage(requeue=False) from retry_error
+        finally:
+            event_latency.record(
+                routing_key, queue_wait_ms, (time.perf_counter() - started) * 1000
+            )
+
+
+def _queue_wait_ms(headers: Dict[str, Any]) -> float | None:
+    """Get time since publish from the message timestamp headers.
+
+    Returns ``None`` if the headers are missing or malformed.
+    """
     try:
-        # Extract trace_id from message headers
-        if message.headers:
-            trace_id = message.headers.get("trace_id")
-        
-        # Set trace_id in context
-        if trace_id:
-            trace_id_context.set(trace_id)
-            consumer_trace_id_context.set(trace_id)
-        
-        # Parse message body
-        body = json.loads(message.body.decode())
-        event_data = body.get("data", {})
-        user_id = event_data.get("user_id")
-        
-        # Log event with trace_id
-        log = logger.bind(trace_id=trace_id)
-        log.info(
-            "event_received",
-            event_type=routing_key,
-            user_id=user_id,
-            trace_id=trace_id,
-        )
-        
-        # Here you can add business logic for handling events
-        # For example: send notifications, update caches, etc.
-        
-    except Exception as e:
-        log = logger.bind(trace_id=trace_id or trace_id_context.get())
-        log.error(
-            "error_handling_event",
-            routing_key=routing_key,
-            error=str(e),
-            exc_info=True,
-        )
+        if (
+            headers.get(PUBLISHER_HOST_HEADER) == HOSTNAME
+            and PUBLISHED_MONOTONIC_HEADER in headers
+        ):
+            elapsed_ns = time.monotonic_ns() - int(headers[PUBLISHED_MONOTONIC_HEADER])
+        elif PUBLISHED_AT_HEADER in headers:
+            # Wall clock across hosts, subject to clock skew
+            elapsed_ns = time.time_ns() - int(headers[PUBLISHED_AT_HEADER])
+        else:
+            return None
+    except (TypeError, ValueError):
+        return None
+    return round(max(elapsed_ns, 0) / 1_000_000, 3)
 
 
 async def _run_consumer() -> None:
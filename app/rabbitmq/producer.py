@@ -1,20 +1,43 @@
 """RabbitMQ producer."""
 import json
+import socket
+import time
 from typing import Any, Dict
 
 from aio_pika import Message, connect_robust
 from aio_pika.abc import AbstractConnection, AbstractChannel
 
 from app.config import settings
+from app.db.ids import generate_id
 from app.logger import get_logger, trace_id_context
+from app.monitoring.tracing import SpanKind, span
 
 logger = get_logger(__name__)
 
+# Publish timestamp headers; the monotonic one is only comparable on the same host
+PUBLISHED_AT_HEADER = "x-published-at-ns"
+PUBLISHED_MONOTONIC_HEADER = "x-published-monotonic-ns"
+PUBLISHER_HOST_HEADER = "x-publisher-host"
+TRACEPARENT_HEADER = "traceparent"
+# Event ID used by change feed clients to resume
+EVENT_ID_HEADER = "x-event-id"
+
+HOSTNAME = socket.gethostname()
+
 # Global connection and channel
 _connection: AbstractConnection | None = None
 _channel: AbstractChannel | None = None
 
 
+def new_event_id() -> str:
+    """Get a unique event ID.
+
+    The snowflake part orders events of one publisher; the host name keeps IDs
+    of publishers sharing a ``WORKER_ID`` apart.
+    """
+    return f"{generate_id()}-{HOSTNAME}"
+
+
 async def init_rabbitmq() -> None:
     """Initialize RabbitMQ connection."""
     global _connection, _channel
@@ -63,16 +86,28 @@ async def publish_user_event(event_type: str, data: Dict[str, Any]) -> None:
             "trace_id": trace_id,
         }
         
-        message = Message(
-            body=json.dumps(event_data).encode(),
-            headers={"trace_id": trace_id} if trace_id else {},
-        )
-        
-        exchange = await _channel.get_exchange("user_events")
-        await exchange.publish(
-            message,
-            routing_key=event_type,
-        )
+        with span(
+            f"publish {event_type}",
+            SpanKind.PRODUCER,
+            attributes={"messaging.destination": "user_events"},
+        ) as publish_span:
+            headers = {
+                EVENT_ID_HEADER: new_event_id(),
+                PUBLISHED_AT_HEADER: time.time_ns(),
+                PUBLISHED_MONOTONIC_HEADER: time.monotonic_ns(),
+                PUBLISHER_HOST_HEADER: HOSTNAME,
+                TRACEPARENT_HEADER: publish_span.traceparent,
+            }
+            if trace_id:
+                headers["trace_id"] = trace_id
+            
+            message = Message(body=json.dumps(event_data).encode(), headers=headers)
+            
+            exchange = await _channel.get_exchange("user_events")
+            await exchange.publish(
+                message,
+                routing_key=event_type,
+            )
         
         logger.info(
             "event_published",
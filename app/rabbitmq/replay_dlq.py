@@ -0,0 +1,105 @@
+"""Replay messages from the dead-letter queue.
+
+Usage:
+    python -m app.rabbitmq.replay_dlq [--limit N]
+"""
+import argparse
+import asyncio
+from typing import Any, Dict
+
+from aio_pika import Message, connect_robust
+
+from app.config import settings
+from app.logger import configure_logging, get_logger
+from app.rabbitmq.retry import (
+    DLQ_NAME,
+    LAST_ERROR_HEADER,
+    ORIGINAL_ROUTING_KEY_HEADER,
+    RETRY_COUNT_HEADER,
+    UNROUTABLE_QUEUE_NAME,
+)
+
+logger = get_logger(__name__)
+
+
+def _source_queue(headers: Dict[str, Any]) -> str | None:
+    """Get the queue a dead-lettered message came from."""
+    routing_key = headers.pop(ORIGINAL_ROUTING_KEY_HEADER, None)
+    if routing_key:
+        return str(routing_key)
+
+    # Rejected by the consumer and dead-lettered by the broker
+    deaths = headers.pop("x-death", None) or []
+    return str(deaths[0]["queue"]) if deaths and deaths[0].get("queue") else None
+
+
+async def replay_dlq(limit: int | None = None) -> int:
+    """Move messages from the DLQ back to their source queues.
+
+    Messages are republished through the default exchange with the retry
+    counter reset and acked only after the broker confirmed the publish.
+    Messages without a source queue are moved to ``UNROUTABLE_QUEUE_NAME``.
+    """
+    connection = await connect_robust(settings.rabbitmq_url)
+    replayed = 0
+    unroutable = 0
+    try:
+        channel = await connection.channel()
+        await channel.set_qos(prefetch_count=100)
+        queue = await channel.declare_queue(DLQ_NAME, durable=True)
+        await channel.declare_queue(UNROUTABLE_QUEUE_NAME, durable=True)
+
+        while limit is None or replayed < limit:
+            incoming = await queue.get(no_ack=False, fail=False)
+            if incoming is None:
+                break
+
+            headers = dict(incoming.headers or {})
+            routing_key = _source_queue(headers)
+            if not routing_key:
+                # Move it aside, so it does not block the rest of the DLQ
+                logger.warning("dlq_message_without_routing_key", message_id=incoming.message_id)
+                await channel.default_exchange.publish(
+                    Message(
+                        body=incoming.body,
+                        headers=dict(incoming.headers or {}),
+                        delivery_mode=incoming.delivery_mode,
+                    ),
+                    routing_key=UNROUTABLE_QUEUE_NAME,
+                )
+                await incoming.ack()
+                unroutable += 1
+                continue
+
+            headers.pop(RETRY_COUNT_HEADER, None)
+            headers.pop(LAST_ERROR_HEADER, None)
+
+            await channel.default_exchange.publish(
+                Message(
+                    body=incoming.body,
+                    headers=headers,
+                    delivery_mode=incoming.delivery_mode,
+                ),
+                routing_key=routing_key,
+            )
+            await incoming.ack()
+            replayed += 1
+    finally:
+        await connection.close()
+
+    logger.info("dlq_replayed", count=replayed, unroutable=unroutable)
+    return replayed
+
+
+def main() -> None:
+    """CLI entrypoint."""
+    parser = argparse.ArgumentParser(description="Replay messages from the dead-letter queue")
+    parser.add_argument("--limit", type=int, default=None, help="Max messages to replay")
+    args = parser.parse_args()
+
+    configure_logging()
+    asyncio.run(replay_dlq(limit=args.limit))
+
+
+if __name__ == "__main__":
+    main()
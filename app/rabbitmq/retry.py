@@ -0,0 +1,113 @@
+"""RabbitMQ delayed retries and dead-letter queue."""
+from typing import Any, Dict
+
+from faststream.rabbit import ExchangeType, RabbitBroker, RabbitExchange, RabbitQueue
+from faststream.rabbit.annotations import RabbitMessage
+
+from app.config import settings
+from app.logger import get_logger
+
+logger = get_logger(__name__)
+
+RETRY_COUNT_HEADER = "x-retry-count"
+ORIGINAL_ROUTING_KEY_HEADER = "x-original-routing-key"
+LAST_ERROR_HEADER = "x-last-error"
+
+DLQ_NAME = "user_events.dlq"
+# DLQ messages the replay cannot route back, kept for manual inspection
+UNROUTABLE_QUEUE_NAME = "user_events.dlq.unroutable"
+
+
+def source_queue(name: str) -> RabbitQueue:
+    """Get a consumer queue that dead-letters rejected messages to the DLQ.
+
+    Used when a failed message cannot even be republished for a retry, so it
+    is rejected without requeue instead of being redelivered in a tight loop.
+    """
+    return RabbitQueue(
+        name,
+        arguments={
+            "x-dead-letter-exchange": "",
+            "x-dead-letter-routing-key": DLQ_NAME,
+        },
+    )
+
+
+def retry_delay_ms(attempt: int) -> int:
+    """Get backoff delay for the given retry attempt (0-based)."""
+    return settings.rabbitmq_retry_base_delay_ms * 2**attempt
+
+
+def retry_tier_name(attempt: int) -> str:
+    """Get name of the delay exchange and queue for the given retry attempt."""
+    return f"user_events.retry.{retry_delay_ms(attempt)}ms"
+
+
+async def declare_retry_topology(broker: RabbitBroker) -> None:
+    """Declare delay queues and the dead-letter queue.
+
+    Every tier is a fanout exchange bound to a queue without consumers. Messages
+    expire after the tier TTL and are dead-lettered to the default exchange, which
+    routes them back to the source queue by its name (kept as the routing key).
+    """
+    for attempt in range(settings.rabbitmq_max_retries):
+        name = retry_tier_name(attempt)
+        exchange = await broker.declare_exchange(
+            RabbitExchange(name, type=ExchangeType.FANOUT, durable=True)
+        )
+        queue = await broker.declare_queue(
+            RabbitQueue(
+                name,
+                durable=True,
+                arguments={
+                    "x-message-ttl": retry_delay_ms(attempt),
+                    "x-dead-letter-exchange": "",
+                },
+            )
+        )
+        await queue.bind(exchange)
+
+    await broker.declare_queue(RabbitQueue(DLQ_NAME, durable=True))
+    logger.info(
+        "retry_topology_declared",
+        max_retries=settings.rabbitmq_max_retries,
+        base_delay_ms=settings.rabbitmq_retry_base_delay_ms,
+    )
+
+
+async def schedule_retry(
+    broker: RabbitBroker, message: RabbitMessage, queue_name: str, error: Exception
+) -> None:
+    """Republish a failed message to the next delay tier or to the DLQ."""
+    headers: Dict[str, Any] = dict(message.headers or {})
+    attempt = int(headers.get(RETRY_COUNT_HEADER, 0))
+    headers[RETRY_COUNT_HEADER] = attempt + 1
+    headers[ORIGINAL_ROUTING_KEY_HEADER] = queue_name
+    headers[LAST_ERROR_HEADER] = str(error)[:1024]
+
+    if attempt >= settings.rabbitmq_max_retries:
+        await broker.publish(message.body, queue=DLQ_NAME, headers=headers, persist=True)
+        logger.error(
+            "event_dead_lettered",
+            routing_key=queue_name,
+            attempts=attempt + 1,
+            error=str(error),
+        )
+        return
+
+    await broker.publish(
+        message.body,
+        exchange=RabbitExchange(
+            retry_tier_name(attempt), type=ExchangeType.FANOUT, durable=True
+        ),
+        routing_key=queue_name,
+        headers=headers,
+        persist=True,
+    )
+    logger.warning(
+        "event_retry_scheduled",
+        routing_key=queue_name,
+        attempt=attempt + 1,
+        delay_ms=retry_delay_ms(attempt),
+        error=str(error),
+    )
@@ -1,5 +1,32 @@
 """Schemas module."""
-from app.schemas.user import UserCreate, UserResponse, UserUpdate
-
-__all__ = ["UserCreate", "UserResponse", "UserUpdate"]
+from app.schemas.metrics import (
+    EventLatencyMetrics,
+    EventLoopMetrics,
+    HistogramSnapshot,
+    MetricsResponse,
+)
+from app.schemas.user import (
+    DailySignups,
+    UserChangeEvent,
+    UserCreate,
+    UserImportError,
+    UserImportResult,
+    UserResponse,
+    UserStatsResponse,
+    UserUpdate,
+)
 
+__all__ = [
+    "DailySignups",
+    "EventLatencyMetrics",
+    "EventLoopMetrics",
+    "HistogramSnapshot",
+    "MetricsResponse",
+    "UserChangeEvent",
+    "UserCreate",
+    "UserImportError",
+    "UserImportResult",
+    "UserResponse",
+    "UserStatsResponse",
+    "UserUpdate",
+]
@@ -0,0 +1,37 @@
+"""Metrics schemas."""
+from typing import Dict
+
+from msgspec import Struct
+
+
+class HistogramSnapshot(Struct):
+    """Schema for a histogram snapshot."""
+
+    buckets: Dict[str, int]
+    count: int
+    sum: float
+    max: float
+
+
+class EventLoopMetrics(Struct):
+    """Schema for event loop metrics."""
+
+    lag_ms: HistogramSnapshot
+    blocked_count: int
+    pending_tasks: int
+    max_pending_tasks: int
+
+
+class EventLatencyMetrics(Struct):
+    """Schema for event delivery latency of one routing key."""
+
+    publish_to_consume_ms: HistogramSnapshot
+    queue_wait_ms: HistogramSnapshot
+    handler_ms: HistogramSnapshot
+
+
+class MetricsResponse(Struct):
+    """Schema for metrics response."""
+
+    event_loop: EventLoopMetrics
+    events: Dict[str, EventLatencyMetrics]
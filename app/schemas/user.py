@@ -1,5 +1,6 @@
 """User schemas."""
-from datetime import datetime
+from datetime import date, datetime
+from typing import Any, Dict, List
 
 from msgspec import Struct
 
@@ -32,3 +33,43 @@ class UserResponse(UserBase):
     created_at: datetime
     updated_at: datetime
 
+
+
+class UserImportError(Struct):
+    """Schema for a rejected import row."""
+
+    line: int
+    error: str
+
+
+class UserImportResult(Struct):
+    """Schema for bulk import summary."""
+
+    imported: int
+    failed: int
+    errors: List[UserImportError]
+    imported_at: datetime
+
+
+class DailySignups(Struct):
+    """Schema for sign-ups on a single day."""
+
+    day: date
+    signups: int
+
+
+class UserStatsResponse(Struct):
+    """Schema for user statistics."""
+
+    total: int
+    signups_per_day: List[DailySignups]
+    reconciled_at: datetime | None
+
+
+class UserChangeEvent(Struct):
+    """Schema for a change feed event."""
+
+    id: str
+    event_type: str
+    data: Dict[str, Any]
+    trace_id: str | None = None
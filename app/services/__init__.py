@@ -1,5 +1,14 @@
 """Services module."""
 from app.services.user import UserService
+from app.services.user_import import UserImportService
+from app.services.user_read import AsyncpgUserReader, OrmUserReader, UserReader
+from app.services.user_stats import UserStatsService
 
-__all__ = ["UserService"]
-
+__all__ = [
+    "AsyncpgUserReader",
+    "OrmUserReader",
+    "UserImportService",
+    "UserReader",
+    "UserService",
+    "UserStatsService",
+]
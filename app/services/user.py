@@ -1,12 +1,16 @@
 """User service."""
-from typing import List
+from datetime import datetime, timezone
+from typing import List, Tuple
 
 from litestar.exceptions import NotFoundException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.base import get_db_timestamp
+from app.db.ids import generate_id, use_app_generated_ids
 from app.db.models import User
 from app.logger import get_logger
+from app.monitoring.tracing import traced
 from app.repositories.user import UserRepository
 from app.schemas.user import UserCreate, UserUpdate
 
@@ -21,8 +25,9 @@ class UserService:
         self.session = session
         self.repository = UserRepository(session=session)
 
-    async def create_user(self, user_data: UserCreate) -> User:
-        """Create a new user."""
+    @traced()
+    async def create_user(self, user_data: UserCreate) -> Tuple[User, datetime]:
+        """Create a new user and return it with the commit time."""
         logger.info("creating_user", name=user_data.name, surname=user_data.surname)
         
         user = User(
@@ -31,13 +36,25 @@ class UserService:
             password=user_data.password,  # In production, hash the password
         )
         
-        user = await self.repository.add(user)
-        await self.session.commit()
-        await self.session.refresh(user)
+        if use_app_generated_ids():
+            # Everything is known before the INSERT, no RETURNING or refresh needed
+            now = datetime.now(timezone.utc)
+            user.id = generate_id()
+            user.created_at = now
+            user.updated_at = now
+            self.session.add(user)
+            committed_at = await get_db_timestamp(self.session)
+            await self.session.commit()
+        else:
+            user = await self.repository.add(user)
+            committed_at = await get_db_timestamp(self.session)
+            await self.session.commit()
+            await self.session.refresh(user)
         
         logger.info("user_created", user_id=user.id)
-        return user
+        return user, committed_at
 
+    @traced()
     async def get_user(self, user_id: int) -> User:
         """Get user by ID."""
         logger.info("getting_user", user_id=user_id)
@@ -49,6 +66,7 @@ class UserService:
         
         return user
 
+    @traced()
     async def get_users(self, skip: int = 0, limit: int = 100) -> List[User]:
         """Get list of users."""
         logger.info("getting_users", skip=skip, limit=limit)
@@ -61,6 +79,7 @@ class UserService:
         logger.info("users_retrieved", count=len(users))
         return list(users)
 
+    @traced()
     async def update_user(self, user_id: int, user_data: UserUpdate) -> User:
         """Update user."""
         logger.info("updating_user", user_id=user_id)
@@ -80,13 +99,16 @@ class UserService:
         logger.info("user_updated", user_id=user.id)
         return user
 
-    async def delete_user(self, user_id: int) -> None:
-        """Delete user."""
+    @traced()
+    async def delete_user(self, user_id: int) -> Tuple[User, datetime]:
+        """Delete user and return the deleted instance with the commit time."""
         logger.info("deleting_user", user_id=user_id)
         
         user = await self.get_user(user_id)
         await self.repository.delete(user)
+        committed_at = await get_db_timestamp(self.session)
         await self.session.commit()
         
         logger.info("user_deleted", user_id=user_id)
+        return user, committed_at
 
@@ -0,0 +1,161 @@
+"""User bulk import service."""
+import csv
+from typing import Any, AsyncIterator, List, Literal, Tuple
+
+import msgspec
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.db.base import get_db_timestamp
+from app.db.ids import generate_id, use_app_generated_ids
+from app.logger import get_logger
+from app.monitoring.tracing import traced
+from app.schemas.user import UserCreate, UserImportError, UserImportResult
+
+logger = get_logger(__name__)
+
+ImportFormat = Literal["csv", "ndjson"]
+
+STAGING_TABLE = "user_import_staging"
+USER_COLUMNS = ["name", "surname", "password"]
+
+# UnicodeDecodeError and msgspec errors are ValueError subclasses
+ROW_ERRORS = (ValueError, csv.Error)
+
+
+async def iter_lines(
+    stream: AsyncIterator[bytes], max_line_bytes: int
+) -> AsyncIterator[Tuple[int, bytes | None]]:
+    """Split a byte stream into numbered lines without buffering the whole stream.
+
+    Lines longer than ``max_line_bytes`` are discarded while reading and
+    yielded as ``None``, so memory stays bounded even without newlines.
+    """
+    buffer = b""
+    line_no = 0
+    skipping = False
+    async for chunk in stream:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_no += 1
+            if skipping or len(line) > max_line_bytes:
+                # Tail of an oversized line, or a whole one within the chunk
+                skipping = False
+                yield line_no, None
+            else:
+                yield line_no, line
+        if len(buffer) > max_line_bytes:
+            skipping = True
+            buffer = b""
+    if skipping:
+        yield line_no + 1, None
+    elif buffer:
+        yield line_no + 1, buffer
+
+
+def decode_line(raw_line: bytes, line_no: int) -> str:
+    """Decode a line, stripping the UTF-8 BOM of the first one and a trailing CR."""
+    return raw_line.decode("utf-8-sig" if line_no == 1 else "utf-8").rstrip("\r")
+
+
+class UserImportService:
+    """User bulk import service.
+
+    Rows are validated against ``UserCreate`` in chunks, copied into a temporary
+    staging table with asyncpg ``copy_records_to_table`` and merged into ``user``
+    with a single ``INSERT ... SELECT``. With app-generated IDs the ``id`` is
+    assigned while staging. CSV records must fit on one line of at most
+    ``IMPORT_MAX_LINE_BYTES``.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize service."""
+        self.session = session
+
+    @traced()
+    async def import_users(
+        self, stream: AsyncIterator[bytes], fmt: ImportFormat
+    ) -> UserImportResult:
+        """Import users from a CSV or NDJSON byte stream."""
+        logger.info("importing_users", format=fmt)
+
+        with_ids = use_app_generated_ids()
+        columns = ["id", *USER_COLUMNS] if with_ids else USER_COLUMNS
+
+        # Run through the session so the transaction is begun before the temp
+        # table exists; the raw connection alone would autocommit and drop it
+        await self.session.execute(
+            text(
+                f"CREATE TEMP TABLE {STAGING_TABLE} "
+                f"({'id bigint NOT NULL, ' if with_ids else ''}"
+                "name text NOT NULL, surname text NOT NULL, password text NOT NULL) "
+                "ON COMMIT DROP"
+            )
+        )
+        connection = await self._get_driver_connection()
+
+        batch: List[Tuple[Any, ...]] = []
+        errors: List[UserImportError] = []
+        failed = 0
+        staged = 0
+        header: List[str] | None = None
+
+        async for line_no, raw_line in iter_lines(stream, settings.import_max_line_bytes):
+            try:
+                if raw_line is None:
+                    raise ValueError(f"Line exceeds {settings.import_max_line_bytes} bytes")
+                line = decode_line(raw_line, line_no)
+                if not line.strip():
+                    continue
+                if fmt == "csv":
+                    row = next(csv.reader([line]))
+                    if header is None:
+                        header = [column.strip() for column in row]
+                        continue
+                    user = msgspec.convert(dict(zip(header, row)), UserCreate)
+                else:
+                    user = msgspec.json.decode(line, type=UserCreate)
+            except ROW_ERRORS as e:
+                failed += 1
+                if len(errors) < settings.import_max_reported_errors:
+                    errors.append(UserImportError(line=line_no, error=str(e)))
+                continue
+
+            row_values = (user.name, user.surname, user.password)
+            batch.append((generate_id(), *row_values) if with_ids else row_values)
+            if len(batch) >= settings.import_chunk_size:
+                staged += await self._copy_batch(connection, batch, columns)
+                batch.clear()
+                logger.info("user_import_progress", staged=staged, failed=failed)
+
+        if batch:
+            staged += await self._copy_batch(connection, batch, columns)
+
+        column_list = ", ".join(columns)
+        result = await self.session.execute(
+            text(f'INSERT INTO "user" ({column_list}) SELECT {column_list} FROM {STAGING_TABLE}')
+        )
+        imported = result.rowcount
+        imported_at = await get_db_timestamp(self.session)
+        await self.session.commit()
+
+        logger.info("users_imported", imported=imported, failed=failed)
+        return UserImportResult(
+            imported=imported, failed=failed, errors=errors, imported_at=imported_at
+        )
+
+    async def _get_driver_connection(self) -> Any:
+        """Get the asyncpg connection bound to the session transaction."""
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        return raw_connection.driver_connection
+
+    @staticmethod
+    async def _copy_batch(
+        connection: Any, batch: List[Tuple[Any, ...]], columns: List[str]
+    ) -> int:
+        """Copy a batch of validated rows into the staging table."""
+        await connection.copy_records_to_table(STAGING_TABLE, records=batch, columns=columns)
+        return len(batch)
@@ -0,0 +1,84 @@
+"""User read paths."""
+from typing import List, Protocol
+
+from asyncpg import Pool
+from litestar.exceptions import NotFoundException
+
+from app.schemas.user import UserResponse
+from app.services.user import UserService
+
+# Column order matches the positional fields of UserResponse
+USER_RESPONSE_COLUMNS = "name, surname, id, created_at, updated_at"
+
+GET_USER_QUERY = f'SELECT {USER_RESPONSE_COLUMNS} FROM "user" WHERE id = $1'
+GET_USERS_QUERY = f'SELECT {USER_RESPONSE_COLUMNS} FROM "user" OFFSET $1 LIMIT $2'
+
+
+class UserReader(Protocol):
+    """Read side of the user API."""
+
+    async def get_user(self, user_id: int) -> UserResponse:
+        """Get user by ID."""
+
+    async def get_users(self, skip: int = 0, limit: int = 100) -> List[UserResponse]:
+        """Get list of users."""
+
+
+class OrmUserReader:
+    """User reader backed by the ORM service."""
+
+    def __init__(self, service: UserService):
+        """Initialize reader."""
+        self.service = service
+
+    async def get_user(self, user_id: int) -> UserResponse:
+        """Get user by ID."""
+        user = await self.service.get_user(user_id)
+        return UserResponse(
+            id=user.id,
+            name=user.name,
+            surname=user.surname,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
+    async def get_users(self, skip: int = 0, limit: int = 100) -> List[UserResponse]:
+        """Get list of users."""
+        users = await self.service.get_users(skip=skip, limit=limit)
+        return [
+            UserResponse(
+                id=user.id,
+                name=user.name,
+                surname=user.surname,
+                created_at=user.created_at,
+                updated_at=user.updated_at,
+            )
+            for user in users
+        ]
+
+
+class AsyncpgUserReader:
+    """User reader backed by a raw asyncpg pool.
+
+    Selects only the response columns and builds ``UserResponse`` structs
+    straight from the records. Queries are prepared once per connection by
+    the asyncpg statement cache.
+    """
+
+    def __init__(self, pool: Pool):
+        """Initialize reader."""
+        self.pool = pool
+
+    async def get_user(self, user_id: int) -> UserResponse:
+        """Get user by ID."""
+        async with self.pool.acquire() as connection:
+            record = await connection.fetchrow(GET_USER_QUERY, user_id)
+        if record is None:
+            raise NotFoundException(f"User with ID {user_id} not found")
+        return UserResponse(*record)
+
+    async def get_users(self, skip: int = 0, limit: int = 100) -> List[UserResponse]:
+        """Get list of users."""
+        async with self.pool.acquire() as connection:
+            records = await connection.fetch(GET_USERS_QUERY, skip, limit)
+        return [UserResponse(*record) for record in records]
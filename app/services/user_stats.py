@@ -0,0 +1,196 @@
+"""User statistics service."""
+import asyncio
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import cast, delete, func, or_, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.types import Date, DateTime
+
+from app.config import settings
+from app.db.base import db_config
+from app.db.models import User, UserDailySignups, UserStats
+from app.logger import get_logger
+from app.schemas.user import DailySignups, UserStatsResponse
+
+logger = get_logger(__name__)
+
+# Primary key of the single user_stats row
+STATS_ROW_ID = 1
+
+# Task for periodic reconciliation
+_reconciler_task: Optional[asyncio.Task] = None
+
+
+class UserStatsService:
+    """User statistics service.
+
+    Aggregates are updated incrementally from user events and periodically
+    reconciled against the ``user`` table, so reads never scan it. The
+    reconcile stores the time of its snapshot in ``reconciled_at``; events
+    committed at or before it are already counted and are skipped. Events are
+    stamped with ``clock_timestamp()`` one round trip before their commit, so a
+    transaction committing in that gap can be missed until the next reconcile.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize service."""
+        self.session = session
+
+    async def get_stats(self, days: int = 30) -> UserStatsResponse:
+        """Get user total and sign-ups for the last ``days`` calendar days, today included."""
+        stats = await self.session.get(UserStats, STATS_ROW_ID)
+        result = await self.session.execute(
+            select(UserDailySignups)
+            .where(UserDailySignups.day > func.current_date() - days)
+            .order_by(UserDailySignups.day.desc())
+        )
+        return UserStatsResponse(
+            total=stats.total if stats else 0,
+            signups_per_day=[
+                DailySignups(day=row.day, signups=row.signups) for row in result.scalars()
+            ],
+            reconciled_at=stats.reconciled_at if stats else None,
+        )
+
+    async def apply_delta(self, day: date, delta: int, occurred_at: datetime) -> bool:
+        """Add ``delta`` users created on ``day`` to the aggregates.
+
+        Returns ``False`` without changes if the last reconcile already
+        covered ``occurred_at``.
+        """
+        applied = await self.session.scalar(
+            insert(UserStats)
+            .values(id=STATS_ROW_ID, total=delta)
+            .on_conflict_do_update(
+                index_elements=[UserStats.id],
+                set_={"total": UserStats.total + delta},
+                where=or_(
+                    UserStats.reconciled_at.is_(None),
+                    UserStats.reconciled_at < occurred_at,
+                ),
+            )
+            .returning(UserStats.id)
+        )
+        if applied is None:
+            await self.session.rollback()
+            return False
+
+        await self.session.execute(
+            insert(UserDailySignups)
+            .values(day=day, signups=delta)
+            .on_conflict_do_update(
+                index_elements=[UserDailySignups.day],
+                set_={"signups": UserDailySignups.signups + delta},
+            )
+        )
+        await self.session.commit()
+        return True
+
+    async def reconcile(self) -> None:
+        """Recompute aggregates from the ``user`` table."""
+        logger.info("reconciling_user_stats")
+
+        # Block incremental updates while the aggregates are rebuilt
+        await self.session.execute(
+            text("LOCK TABLE user_stats, user_daily_signups IN EXCLUSIVE MODE")
+        )
+
+        # The watermark is the start of the statement that takes the snapshot
+        day = cast(User.created_at, Date)
+        snapshot_at = func.statement_timestamp(type_=DateTime(timezone=True))
+        result = await self.session.execute(
+            select(day, func.count(), snapshot_at).group_by(day)
+        )
+        rows = result.all()
+        signups = [(row_day, count) for row_day, count, _ in rows]
+        total = sum(count for _, count in signups)
+        watermark = (
+            rows[0][2] if rows else await self.session.scalar(select(snapshot_at))
+        )
+
+        await self.session.execute(delete(UserDailySignups))
+        if signups:
+            await self.session.execute(
+                insert(UserDailySignups),
+                [{"day": row_day, "signups": count} for row_day, count in signups],
+            )
+        await self.session.execute(
+            insert(UserStats)
+            .values(id=STATS_ROW_ID, total=total, reconciled_at=watermark)
+            .on_conflict_do_update(
+                index_elements=[UserStats.id],
+                set_={"total": total, "reconciled_at": watermark},
+            )
+        )
+        await self.session.commit()
+
+        logger.info(
+            "user_stats_reconciled", total=total, days=len(signups), watermark=str(watermark)
+        )
+
+
+async def apply_user_event(event_type: str, data: Dict[str, Any]) -> None:
+    """Update aggregates from a user event."""
+    if event_type == "user.created":
+        delta = 1
+    elif event_type == "user.deleted":
+        delta = -1
+    elif event_type == "user.imported":
+        delta = int(data.get("imported", 0))
+    else:
+        return
+
+    created_at = data.get("created_at")
+    if not delta or not created_at:
+        return
+
+    # Compared with the reconcile watermark, both are database timestamps
+    occurred_at = _parse_timestamp(data.get("committed_at") or created_at)
+    async with db_config.get_session() as session:
+        applied = await UserStatsService(session=session).apply_delta(
+            _parse_timestamp(created_at).date(), delta, occurred_at
+        )
+    if not applied:
+        logger.debug("user_event_already_reconciled", event_type=event_type)
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an event timestamp, treating ones without an offset as UTC."""
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+async def _run_reconciler() -> None:
+    """Reconcile aggregates periodically."""
+    while True:
+        try:
+            async with db_config.get_session() as session:
+                await UserStatsService(session=session).reconcile()
+        except Exception as e:
+            logger.error("user_stats_reconcile_error", error=str(e), exc_info=True)
+        await asyncio.sleep(settings.stats_reconcile_interval_seconds)
+
+
+async def setup_stats_reconciler() -> None:
+    """Start periodic reconciliation of user statistics."""
+    global _reconciler_task
+
+    _reconciler_task = asyncio.create_task(_run_reconciler())
+    logger.info("user_stats_reconciler_started")
+
+
+async def close_stats_reconciler() -> None:
+    """Stop periodic reconciliation of user statistics."""
+    global _reconciler_task
+
+    if _reconciler_task:
+        _reconciler_task.cancel()
+        try:
+            await _reconciler_task
+        except asyncio.CancelledError:
+            pass
+        _reconciler_task = None
+
+    logger.info("user_stats_reconciler_stopped")
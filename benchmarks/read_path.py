@@ -0,0 +1,71 @@
+"""Compare ORM and raw asyncpg read paths.
+
+Usage:
+    python -m benchmarks.read_path [--iterations N] [--limit N]
+
+Needs a populated database. Each ORM call opens its own session, like a request does.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable, List
+
+from app.db.base import asyncpg_config, db_config
+from app.services.user import UserService
+from app.services.user_read import AsyncpgUserReader, OrmUserReader
+
+
+async def measure(name: str, call: Callable[[], Awaitable[object]], iterations: int) -> None:
+    """Run ``call`` sequentially and print throughput and latency percentiles."""
+    timings: List[float] = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        await call()
+        timings.append((time.perf_counter() - call_started) * 1000)
+    elapsed = time.perf_counter() - started
+
+    timings.sort()
+    print(
+        f"{name:<24} {iterations / elapsed:>10.0f} ops/s"
+        f"  p50={statistics.median(timings):.3f}ms"
+        f"  p99={timings[int(len(timings) * 0.99) - 1]:.3f}ms"
+    )
+
+
+async def main(iterations: int, limit: int) -> None:
+    """Run benchmark."""
+    pool = await asyncpg_config.create_pool()
+    asyncpg_reader = AsyncpgUserReader(pool=pool)
+    try:
+        users = await asyncpg_reader.get_users(limit=1)
+        if not users:
+            raise SystemExit("No users in database, import some first")
+        user_id = users[0].id
+
+        async def orm_get_user() -> None:
+            async with db_config.get_session() as session:
+                await OrmUserReader(UserService(session=session)).get_user(user_id)
+
+        async def orm_get_users() -> None:
+            async with db_config.get_session() as session:
+                await OrmUserReader(UserService(session=session)).get_users(limit=limit)
+
+        await measure("orm get_user", orm_get_user, iterations)
+        await measure("asyncpg get_user", lambda: asyncpg_reader.get_user(user_id), iterations)
+        await measure("orm get_users", orm_get_users, iterations)
+        await measure(
+            "asyncpg get_users", lambda: asyncpg_reader.get_users(limit=limit), iterations
+        )
+    finally:
+        await pool.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare ORM and asyncpg read paths")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--limit", type=int, default=100)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.iterations, args.limit))
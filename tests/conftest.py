@@ -0,0 +1,65 @@
+"""Shared test fixtures."""
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List
+
+import pytest
+from sqlalchemy.dialects.postgresql import asyncpg
+
+
+class RecordingSession:
+    """Async session stand-in that records statements and returns canned results."""
+
+    bind = SimpleNamespace(dialect=asyncpg.dialect())
+
+    def __init__(self, scalars: List[Any] | None = None, rows: List[Any] | None = None):
+        """Initialize session."""
+        self.statements: List[tuple] = []
+        self.added: List[Any] = []
+        self.committed = False
+        self._scalars = list(scalars or [])
+        self._rows = rows or []
+
+    def add(self, instance: Any) -> None:
+        self.added.append(instance)
+
+    async def execute(self, statement: Any, params: Any = None) -> "RecordingSession":
+        self.statements.append((statement, params))
+        return self
+
+    async def scalar(self, statement: Any) -> Any:
+        self.statements.append((statement, None))
+        return self._scalars.pop(0)
+
+    async def get(self, model: Any, ident: Any) -> Any:
+        return None
+
+    def all(self) -> List[Any]:
+        return self._rows
+
+    def scalars(self) -> List[Any]:
+        return self._rows
+
+    async def commit(self) -> None:
+        self.committed = True
+
+    async def rollback(self) -> None:
+        pass
+
+
+@pytest.fixture
+def bind_params() -> Callable[..., Dict[str, Any]]:
+    """Get the bind values of a statement as the asyncpg driver would receive them."""
+    dialect = asyncpg.dialect()
+
+    def render(statement: Any, params: Dict[str, Any] | None = None) -> Dict[str, Any]:
+        if params:
+            # One row of an executemany INSERT
+            statement = statement.values(**params)
+        compiled = statement.compile(dialect=dialect)
+        processors = compiled._bind_processors
+        return {
+            key: processors[key](value) if key in processors else value
+            for key, value in compiled.construct_params().items()
+        }
+
+    return render
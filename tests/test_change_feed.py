@@ -0,0 +1,132 @@
+"""Tests for the user change feed fan-out."""
+import asyncio
+
+import pytest
+
+from app.rabbitmq.change_feed import RESYNC_EVENT, ChangeFeedHub, ChangeFeedSubscription
+from app.rabbitmq.producer import HOSTNAME, new_event_id
+from app.schemas.user import UserChangeEvent
+
+
+def _event(event_id: int, user_id: int = 1) -> UserChangeEvent:
+    return UserChangeEvent(
+        id=f"{event_id}-host", event_type="user.updated", data={"user_id": user_id}
+    )
+
+
+def _ids(events: list) -> list:
+    return [int(event.id.split("-")[0]) for event in events]
+
+
+async def _take(subscription: ChangeFeedSubscription, count: int) -> list:
+    events = subscription.events(ping_interval=1)
+    return [await asyncio.wait_for(anext(events), timeout=1) for _ in range(count)]
+
+
+def test_offer_disconnects_slow_client():
+    subscription = ChangeFeedSubscription(user_ids=None, maxsize=2)
+
+    assert subscription.offer(_event(1), "disconnect")
+    assert subscription.offer(_event(2), "disconnect")
+    assert not subscription.offer(_event(3), "disconnect")
+
+    assert subscription.closed
+    assert subscription.queue.get_nowait() is None
+    assert not subscription.offer(_event(4), "disconnect")
+
+
+def test_offer_drops_oldest_event():
+    subscription = ChangeFeedSubscription(user_ids=None, maxsize=2)
+
+    for event_id in (1, 2, 3):
+        assert subscription.offer(_event(event_id), "drop")
+
+    assert subscription.dropped == 1
+    assert _ids([subscription.queue.get_nowait() for _ in range(2)]) == [2, 3]
+
+
+def test_offer_skips_filtered_users():
+    subscription = ChangeFeedSubscription(user_ids={2}, maxsize=2)
+
+    assert subscription.offer(_event(1, user_id=1), "disconnect")
+    assert subscription.queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_without_resume_gets_only_new_events():
+    hub = ChangeFeedHub(history_size=10, client_buffer=10, slow_client_policy="disconnect")
+    hub.dispatch(_event(1))
+
+    subscription = hub.subscribe()
+    hub.dispatch(_event(2))
+
+    assert _ids(await _take(subscription, 1)) == [2]
+
+
+@pytest.mark.asyncio
+async def test_subscribe_replays_more_than_the_client_buffer():
+    hub = ChangeFeedHub(history_size=10, client_buffer=2, slow_client_policy="disconnect")
+    for event_id in (10, 30, 20, 40, 50):
+        hub.dispatch(_event(event_id))
+
+    # Resume is positional, IDs from different producers need not be sorted
+    subscription = hub.subscribe(last_event_id="30-host")
+    hub.dispatch(_event(60))
+
+    assert not subscription.closed
+    assert _ids(await _take(subscription, 4)) == [20, 40, 50, 60]
+
+
+@pytest.mark.asyncio
+async def test_subscribe_replay_applies_user_filter():
+    hub = ChangeFeedHub(history_size=10, client_buffer=2, slow_client_policy="disconnect")
+    for event_id, user_id in ((1, 1), (2, 2), (3, 1)):
+        hub.dispatch(_event(event_id, user_id=user_id))
+
+    subscription = hub.subscribe(user_ids={1}, last_event_id="1-host")
+    hub.dispatch(_event(4, user_id=1))
+
+    assert _ids(await _take(subscription, 2)) == [3, 4]
+
+
+@pytest.mark.asyncio
+async def test_subscribe_with_unknown_id_requests_resync():
+    hub = ChangeFeedHub(history_size=2, client_buffer=10, slow_client_policy="disconnect")
+    for event_id in (1, 2, 3):
+        hub.dispatch(_event(event_id))
+
+    # Event 1 has already left the history
+    subscription = hub.subscribe(user_ids={5}, last_event_id="1-host")
+    hub.dispatch(_event(4, user_id=5))
+
+    resync, event = await _take(subscription, 2)
+    assert (resync.event_type, resync.id) == (RESYNC_EVENT, "3-host")
+    assert event.id == "4-host"
+
+
+def test_dispatch_disconnects_slow_subscription():
+    hub = ChangeFeedHub(history_size=10, client_buffer=1, slow_client_policy="disconnect")
+    subscription = hub.subscribe()
+
+    hub.dispatch(_event(1))
+    hub.dispatch(_event(2))
+
+    assert subscription.closed
+    assert hub.subscriber_count == 0
+
+
+def test_same_snowflake_from_different_hosts_resumes_at_the_right_event():
+    hub = ChangeFeedHub(history_size=10, client_buffer=10, slow_client_policy="disconnect")
+    for event_id in ("7-a", "7-b", "8-a"):
+        hub.dispatch(UserChangeEvent(id=event_id, event_type="user.updated", data={}))
+
+    replay = hub.subscribe(last_event_id="7-b").replay
+
+    assert [event.id for event in replay] == ["8-a"]
+
+
+def test_event_ids_include_publisher_host():
+    first, second = new_event_id(), new_event_id()
+
+    assert first != second
+    assert first.endswith(f"-{HOSTNAME}")
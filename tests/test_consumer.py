@@ -0,0 +1,61 @@
+"""Tests for the user event consumer."""
+from types import SimpleNamespace
+
+import pytest
+
+from app.rabbitmq import consumer
+from app.rabbitmq.consumer import _queue_wait_ms
+from app.rabbitmq.producer import (
+    HOSTNAME,
+    PUBLISHED_AT_HEADER,
+    PUBLISHED_MONOTONIC_HEADER,
+    PUBLISHER_HOST_HEADER,
+)
+
+
+@pytest.fixture(autouse=True)
+def clocks(monkeypatch):
+    monkeypatch.setattr(
+        consumer, "time", SimpleNamespace(monotonic_ns=lambda: 5_000_000, time_ns=lambda: 9_000_000)
+    )
+
+
+def test_same_host_uses_monotonic_clock():
+    headers = {
+        PUBLISHER_HOST_HEADER: HOSTNAME,
+        PUBLISHED_MONOTONIC_HEADER: 2_500_000,
+        PUBLISHED_AT_HEADER: 1_000_000,
+    }
+
+    assert _queue_wait_ms(headers) == 2.5
+
+
+def test_other_host_uses_wall_clock():
+    headers = {
+        PUBLISHER_HOST_HEADER: "elsewhere",
+        PUBLISHED_MONOTONIC_HEADER: 2_500_000,
+        PUBLISHED_AT_HEADER: 1_000_000,
+    }
+
+    assert _queue_wait_ms(headers) == 8.0
+
+
+def test_clock_skew_is_clamped_to_zero():
+    assert _queue_wait_ms({PUBLISHED_AT_HEADER: 10_000_000}) == 0
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        {PUBLISHED_AT_HEADER: "not-a-number"},
+        {PUBLISHED_AT_HEADER: None},
+        {PUBLISHER_HOST_HEADER: HOSTNAME, PUBLISHED_MONOTONIC_HEADER: b"\xff"},
+    ],
+)
+def test_malformed_headers_are_ignored(headers):
+    assert _queue_wait_ms(headers) is None
+
+
+def test_missing_headers():
+    assert _queue_wait_ms({}) is None
+    assert _queue_wait_ms({PUBLISHER_HOST_HEADER: HOSTNAME}) is None
@@ -0,0 +1,30 @@
+"""Tests for event delivery latency metrics."""
+from app.monitoring.event_metrics import EventLatencyRegistry
+
+
+def test_record_keeps_histograms_per_routing_key():
+    registry = EventLatencyRegistry()
+
+    registry.record("user.created", queue_wait_ms=3, handler_ms=2)
+    registry.record("user.created", queue_wait_ms=7, handler_ms=4)
+    registry.record("user.deleted", queue_wait_ms=1, handler_ms=1)
+
+    snapshot = registry.snapshot()
+    assert set(snapshot) == {"user.created", "user.deleted"}
+    created = snapshot["user.created"]
+    assert (created.queue_wait_ms.count, created.queue_wait_ms.sum) == (2, 10)
+    assert (created.handler_ms.count, created.handler_ms.sum) == (2, 6)
+    assert created.publish_to_consume_ms.sum == 16
+    assert created.publish_to_consume_ms.max == 11
+    assert snapshot["user.deleted"].handler_ms.count == 1
+
+
+def test_record_without_publish_timestamp_only_counts_handler():
+    registry = EventLatencyRegistry()
+
+    registry.record("user.updated", queue_wait_ms=None, handler_ms=5)
+
+    latency = registry.snapshot()["user.updated"]
+    assert latency.handler_ms.count == 1
+    assert latency.queue_wait_ms.count == 0
+    assert latency.publish_to_consume_ms.count == 0
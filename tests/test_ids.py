@@ -0,0 +1,67 @@
+"""Tests for application-generated IDs."""
+import pytest
+
+from app.db import ids
+from app.db.ids import MAX_SEQUENCE, SEQUENCE_BITS, WORKER_ID_BITS, SnowflakeGenerator
+
+EPOCH_MS = 1_000
+
+
+def _timestamp(snowflake: int) -> int:
+    return (snowflake >> (WORKER_ID_BITS + SEQUENCE_BITS)) + EPOCH_MS
+
+
+def _sequence(snowflake: int) -> int:
+    return snowflake & MAX_SEQUENCE
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [5_000]
+    monkeypatch.setattr(ids, "_now_ms", lambda: now[0])
+    return now
+
+
+def test_ids_are_increasing_and_pack_worker_id(clock):
+    generator = SnowflakeGenerator(worker_id=7, epoch_ms=EPOCH_MS)
+
+    first = generator.next_id()
+    second = generator.next_id()
+    clock[0] += 1
+    third = generator.next_id()
+
+    assert first < second < third
+    assert (first >> SEQUENCE_BITS) & ((1 << WORKER_ID_BITS) - 1) == 7
+    assert [_sequence(i) for i in (first, second, third)] == [0, 1, 0]
+    assert _timestamp(third) == 5_001
+
+
+def test_sequence_rollover_borrows_next_millisecond(clock):
+    generator = SnowflakeGenerator(worker_id=0, epoch_ms=EPOCH_MS)
+
+    generated = [generator.next_id() for _ in range(MAX_SEQUENCE + 2)]
+
+    assert generated == sorted(set(generated))
+    assert _timestamp(generated[MAX_SEQUENCE]) == 5_000
+    assert _timestamp(generated[-1]) == 5_001
+    assert _sequence(generated[-1]) == 0
+
+    # The real clock reaching the borrowed millisecond continues its sequence
+    clock[0] = 5_001
+    assert _sequence(generator.next_id()) == 1
+
+
+def test_clock_moving_backwards_keeps_ids_increasing(clock):
+    generator = SnowflakeGenerator(worker_id=0, epoch_ms=EPOCH_MS)
+
+    before = generator.next_id()
+    clock[0] -= 100
+    after = generator.next_id()
+
+    assert after > before
+    assert _timestamp(after) == 5_000
+
+
+def test_worker_id_is_validated():
+    with pytest.raises(ValueError):
+        SnowflakeGenerator(worker_id=1 << WORKER_ID_BITS, epoch_ms=EPOCH_MS)
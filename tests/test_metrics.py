@@ -0,0 +1,35 @@
+"""Tests for in-process metrics."""
+from app.monitoring.metrics import Histogram
+
+
+def test_empty_histogram_snapshot():
+    snapshot = Histogram(buckets=(1, 10)).snapshot()
+
+    assert snapshot.buckets == {"1": 0, "10": 0, "+Inf": 0}
+    assert (snapshot.count, snapshot.sum, snapshot.max) == (0, 0.0, 0.0)
+
+
+def test_snapshot_counts_are_cumulative():
+    histogram = Histogram(buckets=(1, 10, 100))
+    for value in (0.5, 1, 5, 50, 500):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+
+    # Values equal to a bound fall into that bucket
+    assert snapshot.buckets == {"1": 2, "10": 3, "100": 4, "+Inf": 5}
+    assert snapshot.count == 5
+    assert snapshot.sum == 556.5
+    assert snapshot.max == 500
+
+
+def test_snapshot_sorts_buckets_and_rounds_totals():
+    histogram = Histogram(buckets=(10, 1))
+    histogram.observe(0.12345)
+    histogram.observe(0.00001)
+
+    snapshot = histogram.snapshot()
+
+    assert list(snapshot.buckets) == ["1", "10", "+Inf"]
+    assert snapshot.sum == 0.123
+    assert snapshot.max == 0.123
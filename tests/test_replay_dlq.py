@@ -0,0 +1,104 @@
+"""Tests for the dead-letter queue replay."""
+from types import SimpleNamespace
+
+import pytest
+
+from app.rabbitmq import replay_dlq as replay_module
+from app.rabbitmq.replay_dlq import _source_queue, replay_dlq
+from app.rabbitmq.retry import (
+    DLQ_NAME,
+    LAST_ERROR_HEADER,
+    ORIGINAL_ROUTING_KEY_HEADER,
+    RETRY_COUNT_HEADER,
+    UNROUTABLE_QUEUE_NAME,
+)
+
+
+class StubIncoming:
+    """DLQ message recording its ack."""
+
+    def __init__(self, headers):
+        self.body = b"{}"
+        self.headers = headers
+        self.message_id = None
+        self.delivery_mode = None
+        self.acked = False
+
+    async def ack(self):
+        self.acked = True
+
+
+class StubQueue:
+    """Queue handing out its messages one by one."""
+
+    def __init__(self, messages):
+        self.messages = list(messages)
+
+    async def get(self, no_ack, fail):
+        return self.messages.pop(0) if self.messages else None
+
+
+class StubChannel:
+    """Channel recording publishes to the default exchange."""
+
+    def __init__(self, dlq):
+        self.dlq = dlq
+        self.published = []
+        self.default_exchange = SimpleNamespace(publish=self._publish)
+
+    async def _publish(self, message, routing_key):
+        self.published.append((routing_key, dict(message.headers)))
+
+    async def set_qos(self, prefetch_count):
+        pass
+
+    async def declare_queue(self, name, durable):
+        return self.dlq if name == DLQ_NAME else StubQueue([])
+
+
+def test_source_queue_prefers_original_routing_key():
+    headers = {ORIGINAL_ROUTING_KEY_HEADER: "user.created", "x-death": [{"queue": "other"}]}
+
+    assert _source_queue(headers) == "user.created"
+    assert ORIGINAL_ROUTING_KEY_HEADER not in headers
+
+
+def test_source_queue_falls_back_to_x_death():
+    headers = {"x-death": [{"queue": "user.deleted", "reason": "rejected"}]}
+
+    assert _source_queue(headers) == "user.deleted"
+    assert "x-death" not in headers
+
+
+@pytest.mark.parametrize("headers", [{}, {"x-death": []}, {"x-death": [{"reason": "expired"}]}])
+def test_source_queue_unknown(headers):
+    assert _source_queue(headers) is None
+
+
+@pytest.mark.asyncio
+async def test_replay_moves_unroutable_messages_aside(monkeypatch):
+    unroutable = StubIncoming({"trace_id": "abc"})
+    routable = StubIncoming(
+        {
+            ORIGINAL_ROUTING_KEY_HEADER: "user.created",
+            RETRY_COUNT_HEADER: 6,
+            LAST_ERROR_HEADER: "boom",
+            "trace_id": "def",
+        }
+    )
+    channel = StubChannel(StubQueue([unroutable, routable]))
+    connection = SimpleNamespace(channel=lambda: _resolved(channel), close=lambda: _resolved(None))
+    monkeypatch.setattr(replay_module, "connect_robust", lambda url: _resolved(connection))
+
+    replayed = await replay_dlq()
+
+    assert replayed == 1
+    assert unroutable.acked and routable.acked
+    assert channel.published == [
+        (UNROUTABLE_QUEUE_NAME, {"trace_id": "abc"}),
+        ("user.created", {"trace_id": "def"}),
+    ]
+
+
+async def _resolved(value):
+    return value
@@ -0,0 +1,100 @@
+"""Tests for RabbitMQ retry helpers."""
+from types import SimpleNamespace
+
+import pytest
+
+from app.config import settings
+from app.rabbitmq.retry import (
+    DLQ_NAME,
+    LAST_ERROR_HEADER,
+    ORIGINAL_ROUTING_KEY_HEADER,
+    RETRY_COUNT_HEADER,
+    retry_delay_ms,
+    retry_tier_name,
+    schedule_retry,
+    source_queue,
+)
+
+
+class StubBroker:
+    """Broker recording published messages."""
+
+    def __init__(self):
+        self.published = []
+
+    async def publish(self, body, **kwargs):
+        self.published.append((body, kwargs))
+
+
+def test_retry_delay_grows_exponentially(monkeypatch):
+    monkeypatch.setattr(settings, "rabbitmq_retry_base_delay_ms", 1000)
+
+    assert [retry_delay_ms(attempt) for attempt in range(4)] == [1000, 2000, 4000, 8000]
+
+
+def test_retry_tier_name_includes_delay(monkeypatch):
+    monkeypatch.setattr(settings, "rabbitmq_retry_base_delay_ms", 500)
+
+    assert retry_tier_name(0) == "user_events.retry.500ms"
+    assert retry_tier_name(3) == "user_events.retry.4000ms"
+
+
+def test_source_queue_dead_letters_to_dlq():
+    queue = source_queue("user.created")
+
+    assert queue.name == "user.created"
+    assert queue.arguments["x-dead-letter-exchange"] == ""
+    assert queue.arguments["x-dead-letter-routing-key"] == DLQ_NAME
+
+
+@pytest.mark.asyncio
+async def test_first_failure_goes_to_first_tier(monkeypatch):
+    monkeypatch.setattr(settings, "rabbitmq_retry_base_delay_ms", 1000)
+    broker = StubBroker()
+    message = SimpleNamespace(body=b"{}", headers={"trace_id": "abc"})
+
+    await schedule_retry(broker, message, "user.created", RuntimeError("boom"))
+
+    ((body, kwargs),) = broker.published
+    assert body == b"{}"
+    assert kwargs["exchange"].name == "user_events.retry.1000ms"
+    assert kwargs["routing_key"] == "user.created"
+    assert kwargs["persist"] is True
+    assert kwargs["headers"] == {
+        "trace_id": "abc",
+        RETRY_COUNT_HEADER: 1,
+        ORIGINAL_ROUTING_KEY_HEADER: "user.created",
+        LAST_ERROR_HEADER: "boom",
+    }
+    # The incoming message headers are left untouched
+    assert message.headers == {"trace_id": "abc"}
+
+
+@pytest.mark.asyncio
+async def test_retry_count_selects_the_tier(monkeypatch):
+    monkeypatch.setattr(settings, "rabbitmq_retry_base_delay_ms", 1000)
+    monkeypatch.setattr(settings, "rabbitmq_max_retries", 5)
+    broker = StubBroker()
+    message = SimpleNamespace(body=b"{}", headers={RETRY_COUNT_HEADER: 2})
+
+    await schedule_retry(broker, message, "user.deleted", RuntimeError("boom"))
+
+    ((_, kwargs),) = broker.published
+    assert kwargs["exchange"].name == retry_tier_name(2)
+    assert kwargs["headers"][RETRY_COUNT_HEADER] == 3
+
+
+@pytest.mark.asyncio
+async def test_exhausted_retries_go_to_dlq(monkeypatch):
+    monkeypatch.setattr(settings, "rabbitmq_max_retries", 3)
+    broker = StubBroker()
+    message = SimpleNamespace(body=b"{}", headers={RETRY_COUNT_HEADER: 3})
+
+    await schedule_retry(broker, message, "user.imported", RuntimeError("x" * 2000))
+
+    ((_, kwargs),) = broker.published
+    assert kwargs["queue"] == DLQ_NAME
+    assert "exchange" not in kwargs
+    assert kwargs["headers"][RETRY_COUNT_HEADER] == 4
+    assert kwargs["headers"][ORIGINAL_ROUTING_KEY_HEADER] == "user.imported"
+    assert len(kwargs["headers"][LAST_ERROR_HEADER]) == 1024
@@ -0,0 +1,56 @@
+"""Tests for span propagation and export."""
+import json
+
+from app.logger import trace_id_context
+from app.monitoring.tracing import FileSpanExporter, SpanKind, span, start_span
+
+REMOTE_TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+REMOTE_SPAN_ID = "00f067aa0ba902b7"
+
+
+def test_start_span_continues_remote_traceparent():
+    consumed = start_span(
+        "consume user.created",
+        SpanKind.CONSUMER,
+        traceparent=f"00-{REMOTE_TRACE_ID}-{REMOTE_SPAN_ID}-01",
+    )
+
+    assert consumed.trace_id == REMOTE_TRACE_ID
+    assert consumed.parent_span_id == REMOTE_SPAN_ID
+    assert consumed.kind == SpanKind.CONSUMER
+
+
+def test_publish_traceparent_links_consume_span():
+    with span("publish user.created", SpanKind.PRODUCER) as published:
+        traceparent = published.traceparent
+
+    consumed = start_span("consume user.created", SpanKind.CONSUMER, traceparent=traceparent)
+
+    assert consumed.trace_id == published.trace_id
+    assert consumed.parent_span_id == published.span_id
+
+
+def test_malformed_traceparent_falls_back_to_current_span():
+    token = trace_id_context.set(None)
+    try:
+        with span("request") as parent:
+            child = start_span("child", traceparent="garbage")
+    finally:
+        trace_id_context.reset(token)
+
+    assert (child.trace_id, child.parent_span_id) == (parent.trace_id, parent.span_id)
+
+
+def test_exporter_writes_otlp_line(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    exporter = FileSpanExporter(str(path), flush_interval=1)
+    finished = start_span("work")
+    finished.end_ns = finished.start_ns + 1
+
+    exporter._write([finished])
+
+    (line,) = path.read_text().splitlines()
+    (resource_spans,) = json.loads(line)["resourceSpans"]
+    (exported,) = resource_spans["scopeSpans"][0]["spans"]
+    assert exported["spanId"] == finished.span_id
+    assert exported["name"] == "work"
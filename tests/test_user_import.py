@@ -0,0 +1,59 @@
+"""Tests for bulk import stream parsing."""
+from typing import AsyncIterator, List
+
+import pytest
+
+from app.services.user_import import decode_line, iter_lines
+
+
+async def _stream(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def _lines(*chunks: bytes, max_line_bytes: int = 1024) -> List:
+    return [line async for line in iter_lines(_stream(*chunks), max_line_bytes)]
+
+
+@pytest.mark.asyncio
+async def test_iter_lines_joins_lines_across_chunks():
+    assert await _lines(b"name,sur", b"name\nIvan,Iva", b"nov\n", b"Petr,Petrov") == [
+        (1, b"name,surname"),
+        (2, b"Ivan,Ivanov"),
+        (3, b"Petr,Petrov"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iter_lines_keeps_empty_lines_numbered():
+    assert await _lines(b"a\n\nb\n") == [(1, b"a"), (2, b""), (3, b"b")]
+
+
+@pytest.mark.asyncio
+async def test_iter_lines_rejects_oversized_line_within_chunk():
+    assert await _lines(b"ok\n" + b"x" * 20 + b"\nok\n", max_line_bytes=10) == [
+        (1, b"ok"),
+        (2, None),
+        (3, b"ok"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_iter_lines_discards_oversized_line_spanning_chunks():
+    chunks = [b"ok\n", *[b"x" * 8] * 5, b"x\nlast"]
+
+    assert await _lines(*chunks, max_line_bytes=10) == [(1, b"ok"), (2, None), (3, b"last")]
+
+
+@pytest.mark.asyncio
+async def test_iter_lines_rejects_unterminated_oversized_tail():
+    assert await _lines(b"ok\n", b"y" * 30, max_line_bytes=10) == [(1, b"ok"), (2, None)]
+
+
+def test_decode_line_strips_bom_on_first_line_only():
+    assert decode_line("\ufeffname".encode(), 1) == "name"
+    assert decode_line("\ufeffname".encode(), 2) == "\ufeffname"
+
+
+def test_decode_line_strips_crlf():
+    assert decode_line(b"Ivan,Ivanov\r", 2) == "Ivan,Ivanov"
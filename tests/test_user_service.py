@@ -0,0 +1,35 @@
+"""Tests for the user service."""
+from datetime import datetime, timezone
+
+import pytest
+from conftest import RecordingSession
+from sqlalchemy import insert
+
+from app.config import settings
+from app.db.models import User
+from app.schemas.user import UserCreate
+from app.services.user import UserService
+
+
+@pytest.mark.asyncio
+async def test_snowflake_create_user_binds_aware_timestamps(monkeypatch, bind_params):
+    monkeypatch.setattr(settings, "id_strategy", "snowflake")
+    committed_at = datetime.now(timezone.utc)
+    session = RecordingSession(scalars=[committed_at])
+
+    user, stamp = await UserService(session=session).create_user(
+        UserCreate(name="Ada", surname="Lovelace", password="secret")
+    )
+
+    assert session.added == [user] and session.committed
+    assert stamp == committed_at
+    assert user.created_at.tzinfo is not None
+
+    # The INSERT the flush would issue, with the values set by the service
+    values = bind_params(
+        insert(User).values(
+            {column.key: getattr(user, column.key) for column in User.__table__.columns}
+        )
+    )
+    assert values["id"] == user.id
+    assert values["created_at"] == values["updated_at"] == user.created_at
@@ -0,0 +1,88 @@
+"""Tests for user statistics aggregates."""
+from datetime import date, datetime, timezone
+
+import pytest
+from conftest import RecordingSession
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from app.db.models import UserStats
+from app.services.user_stats import UserStatsService, _parse_timestamp
+
+SNAPSHOT_AT = datetime(2026, 1, 2, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_apply_delta_binds_aware_timestamps(bind_params):
+    session = RecordingSession(scalars=[1])
+
+    applied = await UserStatsService(session=session).apply_delta(
+        date(2026, 1, 2), 1, SNAPSHOT_AT
+    )
+
+    assert applied and session.committed
+    stats_update, daily_update = (bind_params(statement) for statement, _ in session.statements)
+    assert SNAPSHOT_AT in stats_update.values()
+    assert date(2026, 1, 2) in daily_update.values()
+
+
+@pytest.mark.asyncio
+async def test_apply_delta_skips_events_covered_by_reconcile():
+    session = RecordingSession(scalars=[None])
+
+    applied = await UserStatsService(session=session).apply_delta(
+        date(2026, 1, 2), 1, SNAPSHOT_AT
+    )
+
+    assert not applied and not session.committed
+    assert len(session.statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_reconcile_stores_snapshot_time_as_watermark(bind_params):
+    session = RecordingSession(
+        rows=[(date(2026, 1, 1), 2, SNAPSHOT_AT), (date(2026, 1, 2), 3, SNAPSHOT_AT)]
+    )
+
+    await UserStatsService(session=session).reconcile()
+
+    *_, (daily_insert, daily_rows), (stats_upsert, _) = session.statements
+    assert [bind_params(daily_insert, row)["signups"] for row in daily_rows] == [2, 3]
+    values = bind_params(stats_upsert)
+    assert values["total"] == 5
+    assert values["reconciled_at"] == SNAPSHOT_AT
+    assert session.committed
+
+
+@pytest.mark.asyncio
+async def test_reconcile_without_users_still_sets_watermark(bind_params):
+    session = RecordingSession(scalars=[SNAPSHOT_AT], rows=[])
+
+    await UserStatsService(session=session).reconcile()
+
+    values = bind_params(session.statements[-1][0])
+    assert (values["total"], values["reconciled_at"]) == (0, SNAPSHOT_AT)
+
+
+@pytest.mark.asyncio
+async def test_get_stats_filters_by_calendar_days(bind_params):
+    session = RecordingSession(rows=[])
+
+    stats = await UserStatsService(session=session).get_stats(days=7)
+
+    assert stats.total == 0
+    statement = session.statements[0][0]
+    sql = str(statement.compile(dialect=asyncpg.dialect()))
+    assert "CURRENT_DATE - " in sql and "LIMIT" not in sql
+    assert 7 in bind_params(statement).values()
+
+
+def test_naive_watermark_is_rejected(bind_params):
+    # reconciled_at is timestamptz, naive values fail before reaching the driver
+    with pytest.raises(TypeError):
+        bind_params(update(UserStats).values(reconciled_at=datetime(2026, 1, 2)))
+
+
+def test_parse_timestamp_assumes_utc_without_offset():
+    assert _parse_timestamp("2026-01-02T12:00:00") == SNAPSHOT_AT
+    assert _parse_timestamp("2026-01-02T14:00:00+02:00") == SNAPSHOT_AT